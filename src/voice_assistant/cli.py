@@ -73,10 +73,32 @@ Examples:
     )
 
     # Test hotword native command
-    subparsers.add_parser(
+    native_parser = subparsers.add_parser(
         "test-hotword-native",
         help="Test hotword using native paInt16 mono (official openWakeWord method)",
     )
+    native_parser.add_argument(
+        "--int8",
+        action="store_true",
+        help="Use int8-quantized wake word and embedding models",
+    )
+    native_parser.add_argument(
+        "--batch",
+        type=int,
+        default=1,
+        help="Number of 80ms frames scored per predict() call (default: 1)",
+    )
+    native_parser.add_argument(
+        "--replay",
+        metavar="WAV",
+        help="Score a recorded 16kHz mono WAV file instead of the microphone",
+    )
+    native_parser.add_argument(
+        "--peak",
+        type=int,
+        default=0,
+        help="Skip predict() while the int16 peak stays below this level (default: 0, off)",
+    )
 
     # Test STT consumer (event-driven)
     subparsers.add_parser(
@@ -153,7 +175,13 @@ Examples:
         elif args.command == "test-hotword-native":
             from voice_assistant.commands.test_hotword_native import main
 
-            sys.exit(0 if main() else 1)
+            ok = main(
+                use_int8=args.int8,
+                batch_frames=args.batch,
+                replay=args.replay,
+                silence_peak=args.peak,
+            )
+            sys.exit(0 if ok else 1)
 
         elif args.command == "test-stt":
             from voice_assistant.commands.test_stt import main
@@ -10,6 +10,7 @@ from voice_assistant.core import (
     SpeakerService,
     VoiceDetectionService,
 )
+from voice_assistant.logging_setup import setup_logging
 
 logger = logging.getLogger(__name__)
 
@@ -30,21 +31,16 @@ def main(log_level: str | None = None) -> bool:
         # If config fails to load, use defaults
         print(f"Warning: Failed to load configuration: {e}")
         print("Using default logging configuration...")
-        logging.basicConfig(
-            level=logging.INFO,
-            format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        )
+        setup_logging(logging.INFO)
         logger.error(f"Failed to load configuration: {e}")
         return False
 
     # Use CLI argument if provided, otherwise use config value
     effective_log_level = log_level if log_level is not None else config.logging_level
 
-    # Configure logging with the effective level
-    logging.basicConfig(
-        level=getattr(logging, effective_log_level.upper()),
-        format=config.logging_format,
-    )
+    # Configure logging with the effective level (records are written by a
+    # background listener thread, not by the audio/event threads)
+    setup_logging(effective_log_level, config.logging_format)
 
     logger.info("Starting Voice Assistant service...")
 
@@ -69,8 +65,22 @@ def main(log_level: str | None = None) -> bool:
     # Create core components
     event_bus = EventBus()
     audio_handler = AudioHandler(event_bus=event_bus)  # Pass event bus for VAD events
-    hotword_detector = HotwordDetector()
-    detection_service = VoiceDetectionService(audio_handler, event_bus, hotword_detector)
+    # In process mode the inference child loads the model, not this process
+    hotword_detector = HotwordDetector(
+        use_int8=config.hotword_use_int8,
+        num_threads=config.hotword_num_threads,
+        load_model=not config.hotword_inference_process,
+    )
+    detection_service = VoiceDetectionService(
+        audio_handler,
+        event_bus,
+        hotword_detector,
+        silence_filter=config.hotword_silence_filter,
+        silence_rms=config.hotword_silence_rms,
+        silence_entropy=config.hotword_silence_entropy,
+        admission_frames=config.hotword_admission_frames,
+        inference_process=config.hotword_inference_process,
+    )
 
     # Create speaker service for audio playback
     speaker_service = SpeakerService(
@@ -127,6 +137,7 @@ def main(log_level: str | None = None) -> bool:
         speaker_service.cleanup()
         audio_handler.stop_stream()
         audio_handler.cleanup()
+        event_bus.close()
         logger.info("Cleanup complete")
         print("\n✓ Service stopped")
 
@@ -65,35 +65,48 @@ class SimpleRecorder:
         # For X seconds: X * 1000ms / 80ms = X * 12.5 frames
         total_frames = int(self.duration_seconds * 12.5)
 
-        frames = []
+        # Stream frames straight into a WAV file under a temporary name; it is
+        # renamed once the recording is complete
+        output_file = self._recording_path()
+        partial_file = output_file.with_suffix(".wav.part")
+        wf = self._open_wav(partial_file)
+        bytes_written = 0
         self.running = True
         frame_count = 0
+        next_log_frame = 13  # Progress update every second (12.5 frames = 1 second)
+        seconds_counted = 0
 
         logger.info(f"🎤 Recording... (0/{self.duration_seconds}s)")
 
         try:
             while self.running and frame_count < total_frames:
-                # Read raw audio chunk
-                audio_data = self.audio_handler.read_chunk()
-                if not audio_data:
+                # View of the raw audio chunk in the capture ring (no per-chunk copy)
+                audio_data = self.audio_handler.peek_hotword_chunk()
+                if audio_data is None:
                     continue
 
-                # Convert to PCM16 mono for saving
-                pcm16_data = self.audio_handler.convert_to_pcm16_mono(audio_data)
-                frames.append(pcm16_data)
+                try:
+                    # Convert to PCM16 mono (a no-op for mono capture) and write it out.
+                    # writeframesraw skips the per-call header patch; close() fixes it up.
+                    pcm16_data = self.audio_handler.convert_to_pcm16_mono(audio_data)
+                    wf.writeframesraw(pcm16_data)
+                    bytes_written += len(pcm16_data)
+                finally:
+                    self.audio_handler.release_hotword_chunk()
 
                 frame_count += 1
 
-                # Progress update every second (12.5 frames = 1 second)
-                if frame_count % 13 == 0:
-                    elapsed = frame_count * 0.08  # 80ms per frame
-                    logger.info(f"🎤 Recording... ({int(elapsed)}/{self.duration_seconds}s)")
+                if frame_count == next_log_frame:
+                    next_log_frame += 13
+                    seconds_counted += 1
+                    logger.info("🎤 Recording... (%d/%ds)", seconds_counted, self.duration_seconds)
 
         except KeyboardInterrupt:
             logger.info("\n\nRecording interrupted by user")
 
         finally:
             self.audio_handler.cleanup()
+            wf.close()
 
         # Calculate actual duration
         actual_duration = frame_count * 0.08  # 80ms per frame
@@ -103,28 +116,25 @@ class SimpleRecorder:
         logger.info(f"  Captured {frame_count} frames ({actual_duration:.1f} seconds)")
         logger.info("")
 
-        # Save to file
-        if frames:
-            output_file = self._save_recording(frames, actual_duration)
+        # Keep the file
+        if bytes_written:
+            self._save_recording(partial_file, output_file, bytes_written, actual_duration)
 
             # Play back the recording if requested
-            if self.auto_play and output_file:
+            if self.auto_play:
                 self._playback_recording(output_file)
         else:
+            partial_file.unlink(missing_ok=True)
             logger.error("No frames captured!")
             return False
 
         return True
 
-    def _save_recording(self, frames: list, duration: float) -> Path:
-        """Save recorded frames to WAV file.
-
-        Args:
-            frames: List of PCM16 audio frames
-            duration: Duration in seconds
+    def _recording_path(self) -> Path:
+        """Get a timestamped path for a new recording.
 
         Returns:
-            Path to the saved file
+            Path inside the recordings directory (created if needed)
         """
         # Create recordings directory
         output_dir = Path("recordings")
@@ -132,19 +142,40 @@ class SimpleRecorder:
 
         # Generate filename with timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_file = output_dir / f"simple_test_{timestamp}.wav"
+        return output_dir / f"simple_test_{timestamp}.wav"
+
+    def _open_wav(self, path: Path) -> wave.Wave_write:
+        """Open a WAV file for 16-bit 16kHz mono PCM.
+
+        Args:
+            path: File to create
+
+        Returns:
+            Open WAV writer
+        """
+        wf = wave.open(str(path), "wb")
+        wf.setnchannels(1)  # Mono
+        wf.setsampwidth(2)  # 16-bit = 2 bytes
+        wf.setframerate(16000)  # 16kHz
+        return wf
 
-        # Combine all frames
-        audio_data = b"".join(frames)
+    def _save_recording(
+        self, partial_file: Path, output_file: Path, num_bytes: int, duration: float
+    ) -> Path:
+        """Move a finished recording into place.
+
+        Args:
+            partial_file: WAV file the frames were streamed into
+            output_file: Final path of the recording
+            num_bytes: Size of the recorded PCM16 audio in bytes
+            duration: Duration in seconds
 
-        # Save as WAV file
-        with wave.open(str(output_file), "wb") as wf:
-            wf.setnchannels(1)  # Mono
-            wf.setsampwidth(2)  # 16-bit = 2 bytes
-            wf.setframerate(16000)  # 16kHz
-            wf.writeframes(audio_data)
+        Returns:
+            Path to the saved file
+        """
+        partial_file.replace(output_file)
 
-        file_size = len(audio_data) / 1024  # KB
+        file_size = num_bytes / 1024  # KB
 
         logger.info("=" * 60)
         logger.info("RECORDING SAVED")
@@ -185,7 +216,8 @@ class SimpleRecorder:
             logger.info("▶ Playing...")
             result = subprocess.run(
                 ["aplay", str(audio_file)],
-                capture_output=True,
+                stdout=subprocess.DEVNULL,  # Only error text is needed
+                stderr=subprocess.PIPE,
                 text=True,
             )
 
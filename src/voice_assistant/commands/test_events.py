@@ -109,6 +109,7 @@ def main() -> bool:
         print("\n\nCleaning up...")
         audio_handler.stop_stream()
         audio_handler.cleanup()
+        event_bus.close()
         print("✓ Event monitor stopped")
 
 
@@ -1,15 +1,64 @@
 """Test hotword detection using native paInt16 mono (official openWakeWord style)."""
 
+import collections
+import functools
 import signal
+import wave
+from typing import Optional
 
 import numpy as np
 import pyaudio
 from openwakeword.model import Model
 
+from voice_assistant.core import HotwordDetector
+from voice_assistant.core.audio_devices import find_device
+from voice_assistant.core.thread_priority import boost_current_thread
 
-def main() -> bool:
+
+def _open_replay(path: str, rate: int) -> Optional[wave.Wave_read]:
+    """Open a WAV file for replay, checking it is PCM16 mono at the model rate.
+
+    Args:
+        path: WAV file to replay (e.g. one saved by simple-record)
+        rate: Required sample rate in Hz
+
+    Returns:
+        Open wave reader, or None if the file cannot be used
+    """
+    try:
+        wf = wave.open(path, "rb")
+    except (OSError, wave.Error) as e:
+        print(f"ERROR: Could not open {path}: {e}")
+        return None
+    if wf.getnchannels() != 1 or wf.getsampwidth() != 2 or wf.getframerate() != rate:
+        print(f"ERROR: {path} must be 16-bit mono at {rate} Hz")
+        wf.close()
+        return None
+    return wf
+
+
+# Quiet frames held back by the peak gate and scored ahead of the next loud
+# one, so a wake word's soft onset still reaches the model (~1s)
+HELD_FRAMES = 12
+
+
+def main(
+    use_int8: bool = False,
+    batch_frames: int = 1,
+    replay: Optional[str] = None,
+    silence_peak: int = 0,
+) -> bool:
     """Test hotword detection using official openWakeWord method.
 
+    Args:
+        use_int8: Run int8-quantized wake word and embedding models
+        batch_frames: 80ms frames scored per predict() call (more frames means
+                      less per-call overhead but later detections)
+        replay: Score this WAV file (16-bit mono, 16kHz) as fast as possible
+                instead of the microphone
+        silence_peak: Skip predict() while every sample stays below this
+                      absolute int16 level (0 scores every frame)
+
     Returns:
         True if successful, False otherwise
     """
@@ -28,48 +77,69 @@ def main() -> bool:
 
     signal.signal(signal.SIGINT, signal_handler)
 
-    # Find AC108 device
-    p = pyaudio.PyAudio()
-    device_index = None
-
-    for i in range(p.get_device_count()):
-        info = p.get_device_info_by_index(i)
-        if "ac108" in info["name"].lower():
-            device_index = i
-            print(f"Found device: {info['name']} (index {i})")
-            break
-
-    if device_index is None:
-        print("ERROR: Could not find ac108 device")
-        return False
-
-    # Open stream
-    print("\nOpening AC108 in native paInt16 mono format...")
-    print("  Format: paInt16 (16-bit PCM)")
-    print("  Channels: 1 (mono)")
-    print("  Rate: 16000 Hz")
-    print(f"  Chunk: {CHUNK} samples (80ms)")
-    print()
+    p = None
+    mic_stream = None
+    if replay:
+        wf = _open_replay(replay, RATE)
+        if wf is None:
+            return False
+        print(f"Replaying {replay} ({wf.getnframes() / RATE:.1f}s), no audio device opened")
+        print()
+        read_chunk = functools.partial(wf.readframes, CHUNK)
+    else:
+        # Find AC108 device (cached index from the last run when still valid)
+        p = pyaudio.PyAudio()
+        device = find_device(p, "ac108")
+        if device is None:
+            print("ERROR: Could not find ac108 device")
+            return False
+        device_index = device.index
+        print(f"Found device: {device.name} (index {device_index})")
 
-    try:
-        mic_stream = p.open(
-            format=FORMAT,
-            channels=CHANNELS,
-            rate=RATE,
-            input=True,
-            input_device_index=device_index,
-            frames_per_buffer=CHUNK,
-        )
-        print("✓ Stream opened successfully!")
+        # Open stream
+        print("\nOpening AC108 in native paInt16 mono format...")
+        print("  Format: paInt16 (16-bit PCM)")
+        print("  Channels: 1 (mono)")
+        print("  Rate: 16000 Hz")
+        print(f"  Chunk: {CHUNK} samples (80ms)")
+        if batch_frames > 1:
+            print(f"  Batch: {batch_frames} chunks per predict() call")
+        if silence_peak > 0:
+            print(f"  Peak gate: {silence_peak} (quieter frames are not scored)")
         print()
-    except Exception as e:
-        print(f"❌ Failed to open stream: {e}")
-        return False
+
+        try:
+            mic_stream = p.open(
+                format=FORMAT,
+                channels=CHANNELS,
+                rate=RATE,
+                input=True,
+                input_device_index=device_index,
+                frames_per_buffer=CHUNK,
+            )
+            print("✓ Stream opened successfully!")
+            print()
+        except Exception as e:
+            print(f"❌ Failed to open stream: {e}")
+            return False
+        read_chunk = functools.partial(mic_stream.read, CHUNK, exception_on_overflow=False)
 
     # Load model
     print("Loading openWakeWord model...")
-    owwModel = Model(wakeword_models=["alexa"])
-    print("✓ Model loaded")
+    if use_int8:
+        owwModel = HotwordDetector(model_name="alexa", use_int8=True).model
+    else:
+        owwModel = Model(wakeword_models=["alexa"])
+    # Prediction key ("alexa", or the file name of a quantized model)
+    model_key = next(iter(owwModel.models))
+    # Pay the first-call allocation/start-up cost before the first live frame
+    # (HotwordDetector already does this)
+    if not use_int8:
+        silence = np.zeros(CHUNK, dtype=np.int16)
+        for _ in range(3):
+            owwModel.predict(silence)
+        owwModel.reset()
+    print(f"✓ Model loaded ({model_key})")
     print()
 
     print("#" * 70)
@@ -81,36 +151,88 @@ def main() -> bool:
     print("  - int16 numpy array passed to model.predict()")
     print()
     print("Say 'ALEXA' clearly and loudly...")
-    print("Press Ctrl+C to stop")
+    print("Press Ctrl+C to stop (per-second scores print at each detection and on exit)")
     print()
 
     frame_count = 0
+    next_log_frame = 13  # Log every second (12.5 frames @ 80ms)
     max_score_seen = 0.0
     detection_count = 0
 
+    # Last 25 scores (2s at one frame per predict); the all-time max is folded
+    # in from this window at each log line instead of compared every frame
+    recent_scores = np.zeros(25, dtype=np.float32)
+    recent_index = 0
+
+    # Per-second (frame, score, recent max) samples, printed at each detection
+    # and on exit rather than live, so no console write stalls the audio loop
+    telemetry = collections.deque(maxlen=256)
+
+    def print_telemetry():
+        for frame, frame_score, frame_max in telemetry:
+            print(f"Frame {frame:4d}: score = {frame_score:.6f} (recent max: {frame_max:.6f})")
+        telemetry.clear()
+
+    # One batch buffer and int16 view, reused for every read (PyAudio has no
+    # readinto, so each read is copied in rather than wrapped in a new array)
+    chunk_bytes = CHUNK * 2
+    buf = bytearray(batch_frames * chunk_bytes)
+    buf_view = memoryview(buf)
+    audio = np.frombuffer(buf, dtype=np.int16)
+    predict = owwModel.predict
+
+    # Batches held back by the peak gate, as copies since buf is reused
+    held = collections.deque(maxlen=max(1, HELD_FRAMES // batch_frames))
+    gated_frames = 0
+
+    # Reads and scoring share this thread; keep it off the busy cores and
+    # ahead of other processes so frames are not dropped (a replay never
+    # waits for audio, so it is left at normal priority)
+    if mic_stream is not None:
+        boost_current_thread("hotword-native", cpu=3)
+
     while running:
         try:
-            # Get audio - official example style
-            audio = np.frombuffer(
-                mic_stream.read(CHUNK, exception_on_overflow=False), dtype=np.int16
-            )
-
-            # Feed to openWakeWord model - pass int16 directly
-            prediction = owwModel.predict(audio)
+            for offset in range(0, len(buf), chunk_bytes):
+                data = read_chunk()
+                if len(data) < chunk_bytes:
+                    running = False  # End of replay file
+                    break
+                buf_view[offset : offset + chunk_bytes] = data
+            if not running:
+                break
 
-            score = prediction.get("alexa", 0.0)
-            if score > max_score_seen:
-                max_score_seen = score
+            frame_count += batch_frames
 
-            frame_count += 1
+            # Peak gate: two reductions on the int16 view, no float conversion.
+            # A gated batch scores 0.0, so the recent max decays rather than
+            # holding the last scored value.
+            if silence_peak > 0 and max(int(audio.max()), -int(audio.min())) < silence_peak:
+                held.append(bytes(buf))
+                gated_frames += batch_frames
+                score = 0.0
+            # Feed to openWakeWord model - pass int16 directly. For a batch it
+            # steps through every 80ms hop and reports the best score.
+            elif held:
+                # Held lead-in goes first, in order, in the same call
+                held.append(bytes(buf))
+                score = predict(np.frombuffer(b"".join(held), dtype=np.int16))[model_key]
+                held.clear()
+            else:
+                score = predict(audio)[model_key]
+            recent_scores[recent_index] = score
+            recent_index = (recent_index + 1) % len(recent_scores)
 
-            # Log every second (12.5 frames @ 80ms)
-            if frame_count % 13 == 0:
-                print(f"Frame {frame_count:4d}: score = {score:.6f} (max: {max_score_seen:.6f})")
+            if frame_count >= next_log_frame:
+                next_log_frame += 13
+                recent_max = float(recent_scores.max())
+                max_score_seen = max(max_score_seen, recent_max)
+                telemetry.append((frame_count, score, recent_max))
 
             # Detect
             if score >= 0.5:
                 detection_count += 1
+                print_telemetry()
                 print()
                 print(f"🎉 ALEXA DETECTED #{detection_count}! Score: {score:.4f}")
                 print()
@@ -121,15 +243,24 @@ def main() -> bool:
             print(f"Error: {e}")
             break
 
-    mic_stream.stop_stream()
-    mic_stream.close()
-    p.terminate()
+    # Scores since the last log line
+    max_score_seen = max(max_score_seen, float(recent_scores.max()))
+    print_telemetry()
+
+    if mic_stream is not None:
+        mic_stream.stop_stream()
+        mic_stream.close()
+        p.terminate()
+    else:
+        wf.close()
 
     print()
     print("=" * 70)
     print("TEST SUMMARY")
     print("=" * 70)
     print(f"Total frames processed: {frame_count}")
+    if silence_peak > 0:
+        print(f"Frames gated as silent: {gated_frames}")
     print(f"Total detections: {detection_count}")
     print(f"Maximum score seen: {max_score_seen:.6f}")
     print()
@@ -11,6 +11,7 @@ from voice_assistant.core import (
     SpeakerService,
     VoiceDetectionService,
 )
+from voice_assistant.logging_setup import setup_logging
 
 logger = logging.getLogger(__name__)
 
@@ -28,11 +29,8 @@ def main() -> bool:
         print(f"Error loading config: {e}")
         return False
 
-    # Configure logging
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    )
+    # Configure logging (non-blocking - conversation status is logged, not printed)
+    setup_logging(logging.INFO)
 
     print("=" * 70)
     print("🎤 EVENT-DRIVEN OPENAI REALTIME API DEMO")
@@ -109,6 +107,7 @@ def main() -> bool:
         speaker_service.cleanup()
         audio_handler.stop_stream()
         audio_handler.cleanup()
+        event_bus.close()
         print("✓ Cleanup complete")
 
 
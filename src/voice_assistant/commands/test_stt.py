@@ -5,6 +5,7 @@ import logging
 from voice_assistant.config import load_config
 from voice_assistant.consumers import SpeechToTextConsumer
 from voice_assistant.core import AudioHandler, EventBus, HotwordDetector, VoiceDetectionService
+from voice_assistant.logging_setup import setup_logging
 
 logger = logging.getLogger(__name__)
 
@@ -22,11 +23,8 @@ def main() -> bool:
         print(f"Error loading config: {e}")
         return False
 
-    # Configure logging
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    )
+    # Configure logging (non-blocking - transcripts are logged, not printed)
+    setup_logging(logging.INFO)
 
     print("=" * 70)
     print("🎤 EVENT-DRIVEN SPEECH-TO-TEXT DEMO")
@@ -65,6 +63,9 @@ def main() -> bool:
         audio_handler=audio_handler,
         openai_api_key=config.openai_api_key,
         max_recording_duration=30.0,  # Safety limit
+        streaming=config.get("stt.streaming", False),
+        upload_while_recording=config.get("stt.upload_while_recording", False),
+        batch_window=config.get("stt.batch_window", 0.0),
     )
 
     # Start audio stream
@@ -89,4 +90,5 @@ def main() -> bool:
         stt_consumer.cleanup()
         audio_handler.stop_stream()
         audio_handler.cleanup()
+        event_bus.close()
         print("✓ Cleanup complete")
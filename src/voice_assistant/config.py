@@ -88,6 +88,41 @@ class Config:
         """Get hotword detection threshold."""
         return self.get("hotword.threshold", 0.5)
 
+    @property
+    def hotword_use_int8(self) -> bool:
+        """Whether to run the int8-quantized hotword model."""
+        return self.get("hotword.use_int8", False)
+
+    @property
+    def hotword_num_threads(self) -> int:
+        """Get thread count for the hotword feature models."""
+        return self.get("hotword.num_threads", 1)
+
+    @property
+    def hotword_inference_process(self) -> bool:
+        """Whether to score hotwords in a child process instead of a thread."""
+        return self.get("hotword.inference_process", False)
+
+    @property
+    def hotword_silence_filter(self) -> bool:
+        """Whether to hold quiet, noise-like frames back from the hotword model."""
+        return self.get("hotword.silence_filter", False)
+
+    @property
+    def hotword_silence_rms(self) -> float:
+        """Get minimum RMS (int16 units) of the hotword silence filter."""
+        return self.get("hotword.silence_rms", 50.0)
+
+    @property
+    def hotword_silence_entropy(self) -> float:
+        """Get spectral entropy (0-1) at or above which a quiet frame counts as noise."""
+        return self.get("hotword.silence_entropy", 0.85)
+
+    @property
+    def hotword_admission_frames(self) -> int:
+        """Get frames scored unconditionally after a non-silent frame."""
+        return self.get("hotword.admission_frames", 12)
+
     @property
     def vad_aggressiveness(self) -> int:
         """Get VAD aggressiveness level (0-3)."""
@@ -9,14 +9,29 @@ from typing import Optional
 from ..core.audio_handler import AudioHandler
 from ..core.event_bus import EventBus, HotwordEvent, VoiceActivityEvent
 from ..core.speaker_service import SpeakerService
+from ..core.thread_priority import boost_current_thread
 from ..services.openai_client import OpenAIRealtimeClient
 
+try:
+    import uvloop
+
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
 class RealtimeConsumer:
     """Consumes hotword events and enables realtime voice conversation with OpenAI."""
 
+    # Playback write size: OpenAI deltas are small (~20ms), so coalesce them into
+    # 2048-sample PCM16 blocks before handing them to the speaker.
+    WRITE_BLOCK = 2048 * 2
+
+    # CPU core for the audio collection thread (playback uses SpeakerService.THREAD_CPU)
+    THREAD_CPU = 2
+
     def __init__(
         self,
         event_bus: EventBus,
@@ -48,11 +63,20 @@ class RealtimeConsumer:
         self.in_conversation = False
         self.streaming_audio = False
         self.audio_stream_thread: Optional[threading.Thread] = None
+        self._collect_event = threading.Event()  # Set while audio should be collected
+        self._collect_idle = threading.Event()  # Set while the collection worker is paused
+        self._collect_idle.set()
+        # Set by the event loop to have the collection worker (the audio ring's
+        # consumer) drop buffered audio before its next read
+        self._reset_pending = False
+        self._stopped = threading.Event()  # Set on cleanup to end the collection worker
         self.collected_audio = bytearray()  # Collect audio instead of streaming
+        self._delta_accum = bytearray()  # Response audio awaiting a full WRITE_BLOCK
 
         # Event loop for async operations
         self.loop: Optional[asyncio.AbstractEventLoop] = None
         self.loop_thread: Optional[threading.Thread] = None
+        self._loop_ready = threading.Event()  # Set once the loop is running
 
         # Subscribe to events
         self.event_bus.subscribe("hotword_detected", self.on_hotword_detected)
@@ -61,7 +85,12 @@ class RealtimeConsumer:
         logger.info(f"RealtimeConsumer initialized (model={model})")
 
     def start(self):
-        """Start the consumer (initializes async event loop)."""
+        """Start the consumer (initializes async event loop).
+
+        Conversation status is reported through logging only (nothing is printed
+        from the audio/event threads); use setup_logging() to keep log I/O off
+        those threads.
+        """
         if self.loop_thread:
             logger.warning("Consumer already started")
             return
@@ -70,17 +99,23 @@ class RealtimeConsumer:
         self.loop_thread = threading.Thread(target=self._run_event_loop, daemon=True)
         self.loop_thread.start()
 
+        # Long-lived audio collection worker (gated by _collect_event)
+        self.audio_stream_thread = threading.Thread(target=self._stream_audio_loop, daemon=True)
+        self.audio_stream_thread.start()
+
         # Wait for loop to be ready
-        while not self.loop:
-            time.sleep(0.01)
+        self._loop_ready.wait()
 
         logger.info("RealtimeConsumer started")
 
     def _run_event_loop(self):
         """Run asyncio event loop in background thread."""
-        self.loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self.loop)
-        logger.info("Event loop started")
+        # uvloop (libuv/epoll) has lower per-message overhead for the websocket
+        loop = uvloop.new_event_loop() if UVLOOP_AVAILABLE else asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self.loop = loop
+        logger.info(f"Event loop started ({'uvloop' if UVLOOP_AVAILABLE else 'asyncio'})")
+        loop.call_soon(self._loop_ready.set)
         self.loop.run_forever()
 
     def on_hotword_detected(self, event: HotwordEvent):
@@ -92,17 +127,14 @@ class RealtimeConsumer:
         if self.in_conversation:
             # Already in conversation - might be interruption or new command
             logger.info(
-                "Hotword detected during conversation - treating as interruption/new command"
+                f"🎤 New hotword '{event.hotword}' during conversation - "
+                "treating as interruption/new command"
             )
-            print(f"\n🎤 New hotword '{event.hotword}' - restarting conversation...")
-
             # Cancel ongoing response and restart
             if self.loop:
                 asyncio.run_coroutine_threadsafe(self._restart_conversation(), self.loop)
             return
 
-        print(f"\n🎤 Hotword '{event.hotword}' detected! Starting conversation...")
-
         logger.info("🎤 Hotword detected! Starting realtime conversation...")
         logger.info(f"   Hotword: '{event.hotword}' (score: {event.score:.3f})")
         logger.info(f"   Queue size at detection: {event.audio_queue_size} frames")
@@ -124,12 +156,11 @@ class RealtimeConsumer:
             )
             return
 
-        print("🔇 Voice stopped. Getting AI response...")
-
-        logger.info(f"🔇 Voice stopped (duration: {event.duration:.1f}s)")
+        logger.info(f"🔇 Voice stopped (duration: {event.duration:.1f}s). Getting AI response...")
 
         # Stop streaming audio and commit
         self.streaming_audio = False
+        self._collect_event.clear()
 
         if self.loop:
             asyncio.run_coroutine_threadsafe(self._commit_and_respond(), self.loop)
@@ -139,10 +170,7 @@ class RealtimeConsumer:
         try:
             # Reuse existing connection if available and connected
             if self.client and self.client.connected:
-                logger.info("♻️ Reusing existing connection")
-                print("♻️ Connection active! Speak your command...")
-                # Clear collected audio for fresh start
-                self.collected_audio.clear()
+                logger.info("♻️ Reusing existing connection - speak your command...")
             else:
                 # Create new connection
                 if self.client:
@@ -162,26 +190,24 @@ class RealtimeConsumer:
                 self.client.on_error = self._on_error
 
                 # Connect
-                print("⏳ Connecting to OpenAI Realtime API...")
+                logger.info("⏳ Connecting to OpenAI Realtime API...")
                 await self.client.connect()
-                print("✓ Connected! Speak your command...")
+                logger.info("✓ Connected! Speak your command...")
 
                 # Start listening for responses (only once per connection!)
                 self.listen_task = asyncio.create_task(self.client.listen())
                 logger.debug("Started listen task")
 
-            # Start conversation
+            # Start conversation (wakes the collection worker)
+            self.collected_audio.clear()
             self.in_conversation = True
             self.streaming_audio = True
-
-            # Start audio streaming thread
-            self.audio_stream_thread = threading.Thread(target=self._stream_audio_loop, daemon=True)
-            self.audio_stream_thread.start()
+            self._collect_event.set()
 
         except Exception as e:
             logger.error(f"Error starting conversation: {e}", exc_info=True)
-            print(f"\n❌ Error: {e}\n")
             self.in_conversation = False
+            self._collect_event.clear()
 
     async def _restart_conversation(self):
         """Restart conversation (cancel current and start new)."""
@@ -196,30 +222,24 @@ class RealtimeConsumer:
 
             # Stop current audio streaming
             self.streaming_audio = False
+            self._collect_event.clear()
 
-            # Give threads a moment to stop
-            await asyncio.sleep(0.1)
-
-            # Clear playback queue
+            # Clear playback queue (and any partially accumulated response audio)
+            self._delta_accum.clear()
             self.speaker_service.clear_queue()
 
-            # Clear audio queue and collected audio to start fresh
-            self.audio_handler.clear_audio_queue()
-            self.collected_audio.clear()
+            # The collection worker clears the audio ring and collected audio
+            # itself: only the ring's consumer may move its read position
+            self._reset_pending = True
 
             # Restart collecting
             self.streaming_audio = True
+            self._collect_event.set()
 
-            # Start new audio streaming thread
-            self.audio_stream_thread = threading.Thread(target=self._stream_audio_loop, daemon=True)
-            self.audio_stream_thread.start()
-
-            logger.info("✓ Conversation restarted - ready for new command")
-            print("✓ Ready! Speak your new command...")
+            logger.info("✓ Conversation restarted - speak your new command...")
 
         except Exception as e:
             logger.error(f"Error restarting conversation: {e}", exc_info=True)
-            print(f"❌ Restart error: {e}")
 
     async def _commit_and_respond(self):
         """Send collected audio and request response."""
@@ -227,36 +247,64 @@ class RealtimeConsumer:
             if not self.client:
                 return
 
-            print(f"⏳ Processing {len(self.collected_audio)} bytes of audio...")
-            logger.info(f"Sending complete audio: {len(self.collected_audio)} bytes")
+            # The collection thread may still be blocked in read_into() on the
+            # current buffer. Wait until it has left its collect loop: appending
+            # to a buffer with an exported view raises BufferError.
+            paused = await asyncio.to_thread(self._collect_idle.wait, 0.5)
+
+            # Take ownership of the utterance buffer instead of copying it
+            audio, self.collected_audio = self.collected_audio, bytearray()
+
+            logger.info(f"⏳ Sending complete audio: {len(audio)} bytes")
 
             # Send complete audio (bypasses server VAD!)
-            await self.client.send_complete_audio(bytes(self.collected_audio))
+            if paused:
+                with memoryview(audio) as audio_view:
+                    await self.client.send_complete_audio(audio_view)
+            else:
+                logger.warning("Audio collection did not pause in time, sending a copy")
+                await self.client.send_complete_audio(bytes(audio))
 
         except Exception as e:
             logger.error(f"Error sending audio: {e}", exc_info=True)
-            print(f"\n❌ Error: {e}\n")
 
     def _stream_audio_loop(self):
-        """Collect audio from microphone in background thread."""
-        logger.debug("Audio collection thread started")
+        """Collect audio from microphone in a long-lived background thread.
 
-        # Clear collected audio at start
-        self.collected_audio.clear()
-
-        while self.streaming_audio and self.in_conversation:
-            chunk = self.audio_handler.read_audio_chunk(timeout=0.1)
-            if chunk:
-                # Collect audio instead of streaming it
-                self.collected_audio.extend(chunk)
-                logger.debug(
-                    f"Collected audio chunk: {len(chunk)}"
-                    f" bytes (total: {len(self.collected_audio)})"
-                )
+        Sleeps on _collect_event between conversations instead of exiting, so
+        no thread is created per hotword.
+        """
+        logger.debug("Audio collection thread started")
+        boost_current_thread("audio-collect", cpu=self.THREAD_CPU)
+
+        while not self._stopped.is_set():
+            if not self._collect_event.wait(timeout=0.5):
+                continue
+
+            # Cleared before the loop condition is checked, so once the event
+            # loop has cleared _collect_event and seen this set, no read follows
+            self._collect_idle.clear()
+            while self._collect_event.is_set() and self.streaming_audio and self.in_conversation:
+                if self._reset_pending:
+                    self._reset_pending = False
+                    self.audio_handler.clear_audio_queue()
+                    self.collected_audio.clear()
+
+                # Collect audio instead of streaming it (appended in place)
+                n = self.audio_handler.read_audio_into(self.collected_audio, timeout=0.1)
+                if n and logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Collected audio chunk: %d bytes (total: %d)",
+                        n,
+                        len(self.collected_audio),
+                    )
+
+            self._collect_idle.set()
+            logger.debug(
+                f"Audio collection paused. Total collected: {len(self.collected_audio)} bytes"
+            )
 
-        logger.debug(
-            f"Audio collection stopped. Total collected: {len(self.collected_audio)} bytes"
-        )
+        logger.debug("Audio collection thread stopped")
 
     def _on_audio_received(self, audio_data: bytes):
         """Callback when audio delta received from OpenAI.
@@ -264,21 +312,51 @@ class RealtimeConsumer:
         Args:
             audio_data: PCM16 audio data to play
         """
-        logger.debug(f"Received audio chunk: {len(audio_data)} bytes")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Received audio chunk: %d bytes", len(audio_data))
 
         # Send audio to speaker service for playback
         if not self.speaker_service.is_playing():
-            print("🔊 AI is responding...")
-
-        self.speaker_service.play_audio(audio_data)
+            logger.info("🔊 AI is responding...")
+
+        # Coalesce deltas into WRITE_BLOCK-sized writes
+        accum = self._delta_accum
+        block = self.WRITE_BLOCK
+        view = memoryview(audio_data)
+        pos = 0
+
+        # Complete the partial block left over from earlier deltas first
+        if accum:
+            pos = min(block - len(accum), len(view))
+            accum += view[:pos]
+            if len(accum) < block:
+                return
+            self.speaker_service.play_audio(bytes(accum))
+            accum.clear()
+
+        # Whole blocks are queued as views of the decoded delta (immutable bytes,
+        # so nothing is copied); only the tail is kept for the next delta
+        end = pos + (len(view) - pos) // block * block
+        for start in range(pos, end, block):
+            self.speaker_service.play_audio(view[start : start + block])
+        accum += view[end:]
+
+    def _flush_audio(self):
+        """Send any remaining accumulated response audio for playback."""
+        if self._delta_accum:
+            self.speaker_service.play_audio(bytes(self._delta_accum))
+            self._delta_accum.clear()
 
     def _on_response_done(self):
         """Callback when response is complete."""
-        print("\n✓ Response complete\n")
-        logger.info("Response complete")
+        logger.info("✓ Response complete")
 
         # End conversation (order matters!)
         self.streaming_audio = False  # Stop streaming first
+        self._collect_event.clear()
+
+        # Flush the tail of the response before marking content done
+        self._flush_audio()
 
         # Signal that all audio content has been added
         # This will trigger speaking_finished event when playback completes
@@ -312,12 +390,12 @@ class RealtimeConsumer:
         is_critical = not any(err in error_msg for err in non_critical_errors)
 
         if is_critical:
-            print(f"\n❌ API Error: {error_msg}\n")
             logger.error(f"Critical API error: {error_msg}")
 
             # End conversation for critical errors
             self.in_conversation = False
             self.streaming_audio = False
+            self._collect_event.clear()
         else:
             # Just log non-critical errors
             logger.warning(f"Non-critical API message: {error_msg}")
@@ -327,6 +405,8 @@ class RealtimeConsumer:
         # Stop conversation
         self.in_conversation = False
         self.streaming_audio = False
+        self._collect_event.clear()
+        self._stopped.set()
         self.speaker_service.set_playing(False)
 
         # Cancel listen task
@@ -346,6 +426,10 @@ class RealtimeConsumer:
                 self.client = None
                 self.listen_task = None
 
+        # Stop collection worker
+        if self.audio_stream_thread and self.audio_stream_thread.is_alive():
+            self.audio_stream_thread.join(timeout=1.0)
+
         # Stop event loop
         if self.loop:
             self.loop.call_soon_threadsafe(self.loop.stop)
@@ -1,29 +1,108 @@
 """Speech-to-text consumer - subscribes to hotword events and transcribes audio."""
 
+import asyncio
 import io
 import logging
+import queue
+import struct
 import threading
 import time
-import wave
-from typing import Optional
+import uuid
+from typing import Iterator, Optional
 
+import httpx
 import openai
 
 from ..core.audio_handler import AudioHandler
 from ..core.event_bus import EventBus, HotwordEvent, VoiceActivityEvent
+from ..services.transcription_client import OpenAITranscriptionClient
+
+try:
+    import uvloop
+
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+WAV_HEADER_SIZE = 44
+WAV_UNKNOWN_SIZE = 0xFFFFFFFF  # Size fields for a WAV streamed before its length is known
+TRANSCRIPTIONS_URL = "https://api.openai.com/v1/audio/transcriptions"
+WHISPER_MODEL_URL = "https://api.openai.com/v1/models/whisper-1"  # Keepalive target
+
+
+def _build_wav_header(sample_rate: int, channels: int, bits: int, data_size: int) -> bytes:
+    """Build a canonical 44-byte PCM WAV header.
+
+    Args:
+        sample_rate: Sample rate in Hz
+        channels: Number of channels
+        bits: Bits per sample
+        data_size: Size of the PCM data chunk in bytes
+
+    Returns:
+        Header bytes (RIFF size at [4:8], data size at [40:44])
+    """
+    block_align = channels * bits // 8
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        36 + data_size,
+        b"WAVE",
+        b"fmt ",
+        16,  # fmt chunk size
+        1,  # PCM
+        channels,
+        sample_rate,
+        sample_rate * block_align,  # byte rate
+        block_align,
+        bits,
+        b"data",
+        data_size,
+    )
+
+
+class _Upload:
+    """One utterance's chunked Whisper upload (upload_while_recording).
+
+    Each upload owns its abort flag and result, so a new hotword can start the
+    next upload while the previous one is still being joined or torn down.
+    """
+
+    def __init__(self, rec_queue: queue.Queue):
+        """Initialize upload state.
+
+        Args:
+            rec_queue: Recording queue the request body is read from
+        """
+        self.rec_queue = rec_queue
+        self.recording_done = threading.Event()  # Set when the body can be closed
+        self.abort = threading.Event()  # Set when a new hotword supersedes this upload
+        self.transcript: Optional[str] = None
+        self.thread: Optional[threading.Thread] = None
+
 
 class SpeechToTextConsumer:
     """Consumes hotword events and transcribes following audio to text."""
 
+    # WAV header template for 16kHz PCM16 mono - identical for every recording
+    # except the two size fields, which are patched per recording
+    _wav_header_template: bytes = _build_wav_header(
+        sample_rate=16000, channels=1, bits=16, data_size=0
+    )
+
     def __init__(
         self,
         event_bus: EventBus,
         audio_handler: AudioHandler,
         openai_api_key: str,
         max_recording_duration: float = 30.0,
+        streaming: bool = False,
+        streaming_model: str = "gpt-4o-transcribe",
+        keepalive_interval: float = 60.0,
+        upload_while_recording: bool = False,
+        batch_window: float = 0.0,
     ):
         """Initialize STT consumer.
 
@@ -32,25 +111,97 @@ class SpeechToTextConsumer:
             audio_handler: Audio handler to pull audio from
             openai_api_key: OpenAI API key for Whisper
             max_recording_duration: Maximum recording duration (seconds)
+            streaming: Stream audio to a realtime transcription session while the
+                       user speaks instead of uploading a WAV after voice stops
+            streaming_model: Transcription model used in streaming mode
+            keepalive_interval: Seconds between idle pings that keep the Whisper HTTPS
+                                connection warm (0 disables; ignored in streaming mode)
+            upload_while_recording: Start the Whisper upload at the hotword and stream
+                                    frames in a chunked request body as they are
+                                    recorded (ignored in streaming mode)
+            batch_window: Seconds to wait after an utterance for another one; utterances
+                          arriving within the window are transcribed in one Whisper
+                          request (0 disables; Whisper mode only)
         """
         self.event_bus = event_bus
         self.audio_handler = audio_handler
         self.max_recording_duration = max_recording_duration
-
-        # Initialize OpenAI client
-        self.openai_client = openai.OpenAI(api_key=openai_api_key)
-
-        # Recording state
+        self.streaming = streaming
+        self.upload_while_recording = upload_while_recording and not streaming
+        self._api_key = openai_api_key
+        self.batch_window = 0.0 if (streaming or self.upload_while_recording) else batch_window
+
+        # Initialize OpenAI client (its HTTP connection pool is reused across requests)
+        self.openai_client = openai.OpenAI(api_key=openai_api_key, timeout=30.0)
+
+        # Keep the HTTPS connection warm so the first transcription after idle
+        # doesn't pay for a TCP + TLS handshake
+        self.keepalive_interval = 0.0 if streaming else keepalive_interval
+        self._keepalive_timer: Optional[threading.Timer] = None
+        if self.keepalive_interval > 0:
+            threading.Thread(target=self._keepalive_ping, daemon=True).start()
+
+        # Recording state - while recording, the audio handler broadcasts straight
+        # into _rec_queue, which is the recording buffer (no collection thread)
         self.recording = False
-        self.recording_start_time = None
-        self.recorded_frames = []
-        self.recording_thread = None
+        self.recording_start_ns = 0
+
+        # Fixed recording buffer sized to max_recording_duration, with room for the
+        # WAV header in front so the finished recording is uploaded in place
+        self._chunk_duration = audio_handler.chunk_size / audio_handler.sample_rate
+        self._max_chunks = int(max_recording_duration / self._chunk_duration)
+        self._max_duration_ns = int(max_recording_duration * 1_000_000_000)
+        self._deadline_ns = 0  # monotonic_ns() at which the current recording is capped
+        self._rec_buffer = bytearray(
+            WAV_HEADER_SIZE + self._max_chunks * audio_handler.chunk_size * 2
+        )
+        self._rec_view = memoryview(self._rec_buffer)
+        self._rec_write_pos = WAV_HEADER_SIZE
+        self._total_bytes = 0  # PCM bytes recorded so far
+        self.recording_thread = None  # Streaming mode only (forwards to websocket)
+        self._rec_queue: Optional[queue.Queue] = None
+
+        # Chunked upload state (upload_while_recording)
+        self._http: Optional[httpx.Client] = None
+        self._upload: Optional[_Upload] = None  # Upload of the current utterance
+        if self.upload_while_recording:
+            self._http = httpx.Client(timeout=httpx.Timeout(30.0, connect=10.0))
+
+        # Utterance batching (batch_window > 0): finished PCM goes to a worker thread
+        self._batch_queue: queue.Queue = queue.Queue()
+        self._batch_running = self.batch_window > 0
+        if self._batch_running:
+            threading.Thread(target=self._batch_worker, daemon=True).start()
+
+        # Only non-default sample rates need their own header template
+        if audio_handler.sample_rate != 16000:
+            self._wav_header_template = _build_wav_header(
+                sample_rate=audio_handler.sample_rate, channels=1, bits=16, data_size=0
+            )
+
+        # Streaming transcription (persistent websocket on a private event loop)
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.transcriber: Optional[OpenAITranscriptionClient] = None
+        if streaming:
+            # uvloop (libuv/epoll) has lower per-message overhead for the websocket
+            self.loop = uvloop.new_event_loop() if UVLOOP_AVAILABLE else asyncio.new_event_loop()
+            threading.Thread(target=self.loop.run_forever, daemon=True).start()
+            self.transcriber = OpenAITranscriptionClient(
+                api_key=openai_api_key,
+                model=streaming_model,
+                input_sample_rate=audio_handler.sample_rate,
+            )
+            # Connect up front so the first utterance doesn't pay for the handshake
+            asyncio.run_coroutine_threadsafe(self.transcriber.ensure_connected(), self.loop)
 
         # Subscribe to events
         self.event_bus.subscribe("hotword_detected", self.on_hotword_detected)
         self.event_bus.subscribe("voice_activity_stopped", self.on_voice_stopped)
 
-        logger.info(f"SpeechToTextConsumer initialized (max_duration={max_recording_duration}s)")
+        logger.info(
+            f"SpeechToTextConsumer initialized (max_duration={max_recording_duration}s, "
+            f"mode={'streaming' if streaming else 'whisper'})"
+        )
 
     def on_hotword_detected(self, event: HotwordEvent):
         """Handle hotword detected event - start recording.
@@ -60,31 +211,59 @@ class SpeechToTextConsumer:
         """
         if self.recording:
             # Already recording - restart to capture new command
-            logger.info("Hotword detected while recording - restarting recording session")
-            print(f"\n🎤 New hotword '{event.hotword}' detected! Restarting recording...")
+            logger.info(
+                f"🎤 New hotword '{event.hotword}' while recording - restarting recording session"
+            )
 
-            # Stop current recording
+            # Stop current recording (abandon any in-flight upload)
+            if self._upload is not None:
+                self._upload.abort.set()
             self.recording = False
             if self.recording_thread and self.recording_thread.is_alive():
                 self.recording_thread.join(timeout=0.5)
 
             # Clear old frames
-            self.recorded_frames = []
-
-        print(f"\n🎤 Hotword '{event.hotword}' detected! Recording your command...")
+            self._stop_recording_queue()
+            self._rec_write_pos = WAV_HEADER_SIZE
+            self._total_bytes = 0
 
         logger.info("🎤 Hotword detected! Starting recording...")
         logger.info(f"   Hotword: '{event.hotword}' (score: {event.score:.3f})")
         logger.info(f"   Queue size at detection: {event.audio_queue_size} frames")
 
-        # Start recording
-        self.recording = True
-        self.recording_start_time = time.time()
-        self.recorded_frames = []
+        if self.streaming:
+            # Open a fresh utterance on the transcription session
+            try:
+                asyncio.run_coroutine_threadsafe(
+                    self.transcriber.begin_utterance(), self.loop
+                ).result(timeout=5.0)
+            except Exception as e:
+                logger.error(f"Could not start streaming transcription: {e}", exc_info=True)
+                return
 
-        # Start background thread to collect audio
-        self.recording_thread = threading.Thread(target=self._audio_collection_loop, daemon=True)
-        self.recording_thread.start()
+        # Start recording: subscribe a fresh queue to the audio broadcast. Its
+        # maxsize caps the recording at max_recording_duration (the callback
+        # drops frames once it is full).
+        self.recording = True
+        self.recording_start_ns = time.monotonic_ns()
+        self._deadline_ns = self.recording_start_ns + self._max_duration_ns
+        self._rec_write_pos = WAV_HEADER_SIZE
+        self._total_bytes = 0
+        self._rec_queue = queue.Queue(maxsize=self._max_chunks)
+        self.audio_handler.register_queue(self._rec_queue)
+
+        if self.streaming:
+            # Forward audio to the websocket while the user is still speaking
+            self.recording_thread = threading.Thread(target=self._audio_streaming_loop, daemon=True)
+            self.recording_thread.start()
+        elif self.upload_while_recording:
+            # Start the Whisper request now; frames are sent as they arrive
+            self._upload = upload = _Upload(self._rec_queue)
+            upload.thread = threading.Thread(
+                target=self._audio_upload_loop, args=(upload,), daemon=True
+            )
+            self.recording_thread = upload.thread
+            upload.thread.start()
 
         logger.info("✓ Recording started, waiting for voice activity to stop...")
 
@@ -102,140 +281,418 @@ class SpeechToTextConsumer:
             )
             return
 
-        print(f"🔇 Voice stopped. Processing {event.duration:.1f}s of audio...")
+        logger.info(f"🔇 Voice stopped. Processing {event.duration:.1f}s of audio...")
 
-        logger.info(f"🔇 Voice stopped (duration: {event.duration:.1f}s)")
+        if self.upload_while_recording:
+            # Kept out of the shared reset below: _finish_upload only releases the
+            # recording state if a new hotword has not taken it over meanwhile
+            try:
+                self._finish_upload(event)
+            except Exception as e:
+                logger.error(f"Error processing voice stopped event: {e}", exc_info=True)
+            return
 
         try:
-            # Stop recording (this will stop the background thread)
+            # Stop recording (this will stop the streaming thread, if any)
             self.recording = False
 
-            # Wait for recording thread to finish
+            # Wait for streaming thread to finish
             if self.recording_thread and self.recording_thread.is_alive():
                 self.recording_thread.join(timeout=1.0)
 
-            # Collect any remaining audio chunks
+            if self.streaming:
+                self._finish_streaming(event)
+                return
+
+            # Drain the recording queue into the contiguous recording buffer
             self._collect_remaining_audio()
 
-            recording_duration = time.time() - self.recording_start_time
+            recording_duration = (time.monotonic_ns() - self.recording_start_ns) / 1e9
 
-            if not self.recorded_frames:
-                print("❌ No audio recorded")
+            if not self._total_bytes:
                 logger.error("No audio recorded")
                 return
 
             logger.info(
-                f"✓ Recording complete ({recording_duration:.1f}s,"
-                f" {len(self.recorded_frames)} frames)"
+                f"✓ Recording complete ({recording_duration:.1f}s, {self._total_bytes} bytes)"
             )
 
+            if self.batch_window > 0:
+                # Copy out of the reusable recording buffer and let the worker batch it
+                end = WAV_HEADER_SIZE + self._total_bytes
+                self._batch_queue.put(bytes(self._rec_view[WAV_HEADER_SIZE:end]))
+                return
+
             # Convert frames to WAV
-            audio_data = self._frames_to_wav(self.recorded_frames)
+            audio_data = self._frames_to_wav(self._total_bytes)
 
             if not audio_data:
                 logger.error("Failed to convert audio to WAV")
                 return
 
             # Transcribe using OpenAI Whisper
-            print("\n⏳ Sending audio to OpenAI Whisper API (please wait)...")
+            logger.info("⏳ Sending audio to OpenAI Whisper API...")
             transcript = self._transcribe_audio(audio_data)
-
-            if transcript:
-                print("\n" + "=" * 70)
-                print("📝 TRANSCRIPTION")
-                print("=" * 70)
-                print(transcript)
-                print("=" * 70 + "\n")
-
-                logger.info("=" * 70)
-                logger.info("📝 TRANSCRIPTION")
-                logger.info("=" * 70)
-                logger.info(transcript)
-                logger.info("=" * 70)
-            else:
-                print("\n⚠️  No transcription returned from OpenAI\n")
-                logger.warning("No transcription returned")
+            self._report_transcript(transcript)
 
         except Exception as e:
             logger.error(f"Error processing voice stopped event: {e}", exc_info=True)
         finally:
             # Clear recording state
             self.recording = False
-            self.recorded_frames = []
-            self.recording_start_time = None
+            self._stop_recording_queue()
+            self._rec_write_pos = WAV_HEADER_SIZE
+            self._total_bytes = 0
+            self.recording_start_ns = 0
+
+    def _keepalive_ping(self):
+        """Issue a lightweight request on the pooled connection and reschedule."""
+        if not self.recording:
+            try:
+                if self._http is not None:
+                    # Uploads go out on their own client; warm that connection
+                    self._http.get(
+                        WHISPER_MODEL_URL, headers={"Authorization": f"Bearer {self._api_key}"}
+                    ).raise_for_status()
+                else:
+                    self.openai_client.models.retrieve("whisper-1")
+                logger.debug("Whisper connection keepalive ping OK")
+            except Exception as e:
+                logger.debug(f"Whisper keepalive ping failed: {e}")
+
+        if self.keepalive_interval > 0:  # Cleared by cleanup()
+            self._keepalive_timer = threading.Timer(self.keepalive_interval, self._keepalive_ping)
+            self._keepalive_timer.daemon = True
+            self._keepalive_timer.start()
+
+    def _report_transcript(self, transcript: Optional[str]):
+        """Log a transcription result.
 
-    def _audio_collection_loop(self):
-        """Background thread to continuously collect audio while recording."""
-        logger.debug("Audio collection thread started")
+        Args:
+            transcript: Transcribed text, or None/empty if nothing was returned
+        """
+        if transcript:
+            logger.info("=" * 70)
+            logger.info("📝 TRANSCRIPTION")
+            logger.info("=" * 70)
+            logger.info(transcript)
+            logger.info("=" * 70)
+        else:
+            logger.warning("⚠️  No transcription returned from OpenAI")
+
+    def _finish_streaming(self, event: VoiceActivityEvent):
+        """Flush the tail of the utterance, commit it and report the transcript.
+
+        Args:
+            event: Voice activity stopped event
+        """
+        rec_queue = self._rec_queue
+        self.audio_handler.unregister_queue(rec_queue)
+
+        # Forward whatever the callback queued before we unregistered
+        while True:
+            try:
+                chunk = rec_queue.get_nowait()
+            except queue.Empty:
+                break
+            asyncio.run_coroutine_threadsafe(self.transcriber.send_audio(chunk), self.loop)
+
+        logger.info(f"✓ Streamed {event.duration:.1f}s of speech, committing...")
+        start_time = time.time()
+        transcript = asyncio.run_coroutine_threadsafe(self.transcriber.commit(), self.loop).result(
+            timeout=20.0
+        )
+        logger.info(f"✓ Transcript received {time.time() - start_time:.2f}s after voice stopped")
+
+        self._report_transcript(transcript)
+
+    def _finish_upload(self, event: VoiceActivityEvent):
+        """End the chunked upload body and report the transcript.
+
+        Args:
+            event: Voice activity stopped event
+        """
+        # Only this utterance's upload is touched from here on: a new hotword
+        # replaces self._upload while this one is still being joined
+        upload = self._upload
+        if upload is None:
+            return
+
+        # Stop fan-out, then let the body generator drain what is left and close
+        # (unless a new hotword already stopped it and started its own recording)
+        if self._rec_queue is upload.rec_queue:
+            self._stop_recording_queue()
+            self.recording = False
+        upload.recording_done.set()
+
+        logger.info("⏳ Finishing upload to OpenAI Whisper API...")
+        start_time = time.time()
+        upload.thread.join(timeout=35.0)
+        if self._upload is upload:
+            self._upload = None
+
+        if upload.abort.is_set():
+            logger.info("Upload superseded by a new hotword, transcript discarded")
+            return
+        logger.info(
+            f"✓ Transcript received {time.time() - start_time:.2f}s after voice stopped "
+            f"({event.duration:.1f}s of speech)"
+        )
+
+        self._report_transcript(upload.transcript)
+
+    def _upload_body(self, upload: "_Upload", boundary: str) -> Iterator[bytes]:
+        """Yield a multipart/form-data body whose WAV part grows as frames are recorded.
+
+        Args:
+            upload: Upload whose recording queue to pull frames from
+            boundary: Multipart boundary string
+
+        Yields:
+            Body chunks (sent with chunked transfer encoding)
+        """
+        yield (
+            f"--{boundary}\r\n"
+            'Content-Disposition: form-data; name="model"\r\n\r\n'
+            "whisper-1\r\n"
+            f"--{boundary}\r\n"
+            'Content-Disposition: form-data; name="language"\r\n\r\n'
+            "en\r\n"
+            f"--{boundary}\r\n"
+            'Content-Disposition: form-data; name="file"; filename="recording.wav"\r\n'
+            "Content-Type: audio/wav\r\n\r\n"
+        ).encode()
+
+        # Length isn't known yet - use the streaming-WAV size convention
+        header = bytearray(self._wav_header_template)
+        struct.pack_into("<I", header, 4, WAV_UNKNOWN_SIZE)
+        struct.pack_into("<I", header, 40, WAV_UNKNOWN_SIZE)
+        yield bytes(header)
+
+        rec_queue = upload.rec_queue
+        while not upload.recording_done.is_set() or not rec_queue.empty():
+            if upload.abort.is_set():
+                raise RuntimeError("Upload superseded by a new hotword")
+            try:
+                yield rec_queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+        yield f"\r\n--{boundary}--\r\n".encode()
+
+    def _audio_upload_loop(self, upload: "_Upload"):
+        """Background thread: POST the recording to Whisper while it is being recorded.
+
+        Args:
+            upload: Upload state for this utterance (receives the transcript)
+        """
+        logger.debug("Audio upload thread started")
+        boundary = uuid.uuid4().hex
+
+        try:
+            response = self._http.post(
+                TRANSCRIPTIONS_URL,
+                headers={
+                    "Authorization": f"Bearer {self._api_key}",
+                    "Content-Type": f"multipart/form-data; boundary={boundary}",
+                },
+                content=self._upload_body(upload, boundary),
+            )
+            response.raise_for_status()
+            upload.transcript = response.json().get("text")
+        except Exception as e:
+            if not upload.abort.is_set():
+                logger.error(f"Transcription upload error: {e}", exc_info=True)
+
+        logger.debug("Audio upload thread stopped")
+
+    def _stop_recording_queue(self):
+        """Unsubscribe the recording queue from the audio broadcast."""
+        if self._rec_queue is not None:
+            self.audio_handler.unregister_queue(self._rec_queue)
+            self._rec_queue = None
+
+    def _audio_streaming_loop(self):
+        """Background thread to forward audio to the transcription session while recording."""
+        logger.debug("Audio streaming thread started")
+        rec_queue = self._rec_queue
+        deadline_ns = self._deadline_ns
 
         while self.recording:
-            chunk = self.audio_handler.read_audio_chunk(timeout=0.1)
+            try:
+                chunk = rec_queue.get(timeout=0.1)
+            except queue.Empty:
+                chunk = None
             if chunk:
-                self.recorded_frames.append(chunk)
-
-            # Safety check - don't exceed max duration
-            if self.recording_start_time:
-                elapsed = time.time() - self.recording_start_time
-                if elapsed >= self.max_recording_duration:
-                    logger.warning(
-                        f"Max recording duration ({self.max_recording_duration}s) reached"
-                    )
-                    self.recording = False
-                    break
+                asyncio.run_coroutine_threadsafe(self.transcriber.send_audio(chunk), self.loop)
+
+            # Safety check - don't exceed max duration (integer compare, no float math)
+            if time.monotonic_ns() >= deadline_ns:
+                logger.warning(f"Max recording duration ({self.max_recording_duration}s) reached")
+                self.recording = False
+                break
 
-        logger.debug("Audio collection thread stopped")
+        logger.debug("Audio streaming thread stopped")
 
     def _collect_remaining_audio(self):
-        """Collect any remaining audio chunks from the queue (non-blocking)."""
-        timeout = 0.05  # 50ms timeout per chunk
+        """Copy everything in the recording queue into the recording buffer (non-blocking)."""
+        rec_queue = self._rec_queue
+        if rec_queue is None:
+            return
+
+        # Stop fan-out first so the drain below terminates
+        self._stop_recording_queue()
 
+        if rec_queue.full():
+            logger.warning(f"Max recording duration ({self.max_recording_duration}s) reached")
+
+        view = self._rec_view
+        capacity = len(view)
+        pos = self._rec_write_pos
         while True:
-            chunk = self.audio_handler.read_audio_chunk(timeout=timeout)
-            if chunk:
-                self.recorded_frames.append(chunk)
-            else:
-                # No more chunks available
+            try:
+                chunk = rec_queue.get_nowait()
+            except queue.Empty:
                 break
+            end = pos + len(chunk)
+            if end > capacity:  # Can't happen while the queue caps at _max_chunks
+                break
+            view[pos:end] = chunk
+            pos = end
+        self._rec_write_pos = pos
+        self._total_bytes = pos - WAV_HEADER_SIZE
 
-    def _frames_to_wav(self, frames: list) -> Optional[bytes]:
-        """Convert recorded frames to WAV format.
+    def _frames_to_wav(self, total_bytes: int) -> Optional[memoryview]:
+        """Convert the recording buffer to WAV format.
 
         Args:
-            frames: List of raw audio frames (PCM16 mono)
+            total_bytes: Number of PCM bytes recorded
 
         Returns:
-            WAV audio data as bytes, or None if error
+            WAV audio data, or None if error
         """
-        if not frames:
+        if not total_bytes:
             return None
 
-        sample_rate = self.audio_handler.sample_rate
-        return self._create_wav(frames, sample_rate)
+        return self._create_wav(total_bytes)
+
+    def _create_wav(self, total_bytes: int) -> memoryview:
+        """Create WAV file in place in the recording buffer.
+
+        The PCM already sits right after the reserved header space, so only
+        the 44-byte header (with patched size fields) is written - no copy of
+        the recording at all.
+
+        Args:
+            total_bytes: Number of PCM bytes recorded
+
+        Returns:
+            View of the WAV file data (valid until the next recording starts)
+        """
+        buf = self._rec_buffer
+        buf[:WAV_HEADER_SIZE] = self._wav_header_template
+        struct.pack_into("<I", buf, 4, 36 + total_bytes)
+        struct.pack_into("<I", buf, 40, total_bytes)
+
+        return self._rec_view[: WAV_HEADER_SIZE + total_bytes]
 
-    def _create_wav(self, frames: list, sample_rate: int) -> bytes:
-        """Create WAV file from audio frames.
+    def _pcm_to_wav(self, pcm: bytes | bytearray) -> bytearray:
+        """Wrap PCM16 mono audio in a WAV container.
 
         Args:
-            frames: List of raw audio frames (PCM16 mono)
-            sample_rate: Sample rate in Hz
+            pcm: PCM16 mono audio
 
         Returns:
-            WAV file data as bytes
+            WAV file data
         """
-        # Combine all frames
-        audio_data = b"".join(frames)
+        wav = bytearray(WAV_HEADER_SIZE + len(pcm))
+        wav[:WAV_HEADER_SIZE] = self._wav_header_template
+        struct.pack_into("<I", wav, 4, 36 + len(pcm))
+        struct.pack_into("<I", wav, 40, len(pcm))
+        wav[WAV_HEADER_SIZE:] = pcm
+        return wav
+
+    def _batch_worker(self):
+        """Collect utterances that finish within batch_window and transcribe them together."""
+        logger.debug("Batch transcription thread started")
+
+        while self._batch_running:
+            try:
+                batch = [self._batch_queue.get(timeout=0.5)]
+            except queue.Empty:
+                continue
+
+            # Debounce: keep extending the batch while utterances keep arriving
+            while True:
+                try:
+                    batch.append(self._batch_queue.get(timeout=self.batch_window))
+                except queue.Empty:
+                    break
+
+            try:
+                if len(batch) == 1:
+                    logger.info("⏳ Sending audio to OpenAI Whisper API...")
+                    self._report_transcript(self._transcribe_audio(self._pcm_to_wav(batch[0])))
+                else:
+                    for transcript in self._transcribe_batch(batch):
+                        self._report_transcript(transcript)
+            except Exception as e:
+                logger.error(f"Batch transcription error: {e}", exc_info=True)
+
+        logger.debug("Batch transcription thread stopped")
+
+    def _transcribe_batch(self, utterances: list[bytes]) -> list[Optional[str]]:
+        """Transcribe several utterances with one Whisper request.
+
+        Utterances are joined with a short silence gap; segment timestamps from
+        the verbose_json response are used to split the text back out.
+
+        Args:
+            utterances: PCM16 mono audio of each utterance, in order
+
+        Returns:
+            Transcript for each utterance (None if the request failed)
+        """
+        bytes_per_second = self.audio_handler.sample_rate * 2
+        gap = bytes(bytes_per_second // 2)  # 0.5s of silence between utterances
+
+        # Start time (seconds) of each utterance in the combined audio
+        starts = []
+        offset = 0
+        for pcm in utterances:
+            starts.append(offset / bytes_per_second)
+            offset += len(pcm) + len(gap)
+
+        combined = self._pcm_to_wav(gap.join(utterances))
+        logger.info(f"⏳ Sending {len(utterances)} batched utterances to OpenAI Whisper API...")
+
+        try:
+            audio_file = io.BytesIO(combined)
+            audio_file.name = "recording.wav"
 
-        # Create WAV file in memory
-        wav_buffer = io.BytesIO()
-        with wave.open(wav_buffer, "wb") as wav_file:
-            wav_file.setnchannels(1)  # Mono
-            wav_file.setsampwidth(2)  # 16-bit
-            wav_file.setframerate(sample_rate)
-            wav_file.writeframes(audio_data)
+            start_time = time.time()
+            response = self.openai_client.audio.transcriptions.create(
+                model="whisper-1",
+                file=audio_file,
+                language="en",
+                response_format="verbose_json",
+                timestamp_granularities=["segment"],
+            )
+            logger.info(f"✓ Batched transcription completed in {time.time() - start_time:.2f}s")
+        except Exception as e:
+            logger.error(f"Transcription error: {e}", exc_info=True)
+            return [None] * len(utterances)
+
+        # Assign each segment to the utterance its midpoint falls in
+        texts: list[list[str]] = [[] for _ in utterances]
+        for segment in response.segments or []:
+            midpoint = (segment.start + segment.end) / 2
+            index = max(i for i, start in enumerate(starts) if start <= midpoint or i == 0)
+            texts[index].append(segment.text.strip())
 
-        return wav_buffer.getvalue()
+        return [" ".join(parts) or None for parts in texts]
 
-    def _transcribe_audio(self, audio_data: bytes) -> Optional[str]:
+    def _transcribe_audio(self, audio_data: bytes | bytearray | memoryview) -> Optional[str]:
         """Transcribe audio using OpenAI Whisper.
 
         Args:
@@ -271,4 +728,28 @@ class SpeechToTextConsumer:
     def cleanup(self):
         """Cleanup consumer resources."""
         self.event_bus.unsubscribe("hotword_detected", self.on_hotword_detected)
+        self.event_bus.unsubscribe("voice_activity_stopped", self.on_voice_stopped)
+
+        self.recording = False
+        self._stop_recording_queue()
+        self._batch_running = False
+
+        self.keepalive_interval = 0.0
+        if self._keepalive_timer:
+            self._keepalive_timer.cancel()
+
+        if self._http:
+            if self._upload is not None:
+                self._upload.abort.set()
+            self._http.close()
+
+        if self.streaming:
+            try:
+                asyncio.run_coroutine_threadsafe(self.transcriber.disconnect(), self.loop).result(
+                    timeout=2.0
+                )
+            except Exception as e:
+                logger.error(f"Error disconnecting during cleanup: {e}")
+            self.loop.call_soon_threadsafe(self.loop.stop)
+
         logger.info("SpeechToTextConsumer cleaned up")
@@ -2,8 +2,10 @@
 
 from .audio_handler import AudioHandler
 from .detection_service import VoiceDetectionService
-from .event_bus import EventBus, HotwordEvent, VoiceActivityEvent
+from .event_bus import EventBus
+from .events import HotwordEvent, SpeakingFinishedEvent, VoiceActivityEvent
 from .hotword_detector import HotwordDetector
+from .shared_ring import SharedAudioRing
 from .speaker_service import SpeakerService
 
 __all__ = [
@@ -12,6 +14,8 @@ __all__ = [
     "EventBus",
     "HotwordEvent",
     "VoiceActivityEvent",
+    "SpeakingFinishedEvent",
     "HotwordDetector",
+    "SharedAudioRing",
     "SpeakerService",
 ]
@@ -0,0 +1,137 @@
+"""Shared PortAudio instance and cached device enumeration for capture and playback."""
+
+import atexit
+import functools
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+import pyaudio
+
+logger = logging.getLogger(__name__)
+
+# Shared PortAudio instance - initializing PortAudio walks every host API
+# (and /proc/asound on ALSA), so do it once per process, not per component.
+_PA: Optional[pyaudio.PyAudio] = None
+_PA_LOCK = threading.Lock()
+
+# Device found for each search, so the next start can check one index instead
+# of enumerating every device
+DEVICE_CACHE_PATH = Path.home() / ".cache" / "voice-assistant" / "audio_devices.json"
+
+
+def get_pa() -> pyaudio.PyAudio:
+    """Get the process-wide PyAudio instance, creating it on first use.
+
+    Returns:
+        Shared PyAudio instance (terminated automatically at interpreter exit)
+    """
+    global _PA
+    with _PA_LOCK:
+        if _PA is None:
+            _PA = pyaudio.PyAudio()
+            atexit.register(_PA.terminate)
+        return _PA
+
+
+class AudioDevice(NamedTuple):
+    """One PortAudio device, reduced to the fields device selection needs."""
+
+    index: int
+    name: str
+    name_lower: str  # Pre-lowered for case-insensitive matching
+    max_input_channels: int
+    max_output_channels: int
+
+
+@functools.lru_cache(maxsize=1)
+def list_devices(pa: pyaudio.PyAudio) -> tuple[AudioDevice, ...]:
+    """Enumerate PortAudio devices once per PyAudio instance.
+
+    Each get_device_info_by_index() call goes through PortAudio and builds a
+    new dict, which adds up to a noticeable startup delay on the Pi. Call
+    list_devices.cache_clear() after hot-plugging.
+
+    Args:
+        pa: PyAudio instance to query
+
+    Returns:
+        All devices, in PortAudio index order
+    """
+    devices = tuple(
+        _to_device(i, pa.get_device_info_by_index(i)) for i in range(pa.get_device_count())
+    )
+    logger.debug(f"Enumerated {len(devices)} audio devices")
+    return devices
+
+
+def _to_device(index: int, info: dict) -> AudioDevice:
+    """Build an AudioDevice from a PortAudio device info dict."""
+    name = info.get("name", "")
+    return AudioDevice(
+        index=index,
+        name=name,
+        name_lower=name.lower(),
+        max_input_channels=int(info.get("maxInputChannels", 0)),
+        max_output_channels=int(info.get("maxOutputChannels", 0)),
+    )
+
+
+def _load_device_cache() -> dict:
+    """Read the persisted device cache (empty if missing or unreadable)."""
+    try:
+        with open(DEVICE_CACHE_PATH) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _save_device_cache(key: str, device: AudioDevice):
+    """Persist the device found for a search key (best effort)."""
+    cache = _load_device_cache()
+    cache[key] = {"index": device.index, "name": device.name}
+    try:
+        DEVICE_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(DEVICE_CACHE_PATH, "w") as f:
+            json.dump(cache, f)
+    except OSError as e:
+        logger.debug(f"Could not write audio device cache: {e}")
+
+
+def find_device(pa: pyaudio.PyAudio, name: str, output: bool = False) -> Optional[AudioDevice]:
+    """Find the first device whose name contains name (case-insensitive).
+
+    The match is persisted to DEVICE_CACHE_PATH. On later runs the cached index
+    is checked with a single device query and, if it still holds a device of
+    the same name, returned without enumerating the rest.
+
+    Args:
+        pa: PyAudio instance to query
+        name: Partial device name
+        output: Only match output devices (otherwise any device matches)
+
+    Returns:
+        Matching device, or None if there is none
+    """
+    name_lower = name.lower()
+    key = f"{'output' if output else 'any'}:{name_lower}"
+
+    cached = _load_device_cache().get(key)
+    if isinstance(cached, dict):
+        try:
+            device = _to_device(cached["index"], pa.get_device_info_by_index(cached["index"]))
+        except (KeyError, TypeError, ValueError, OSError):
+            device = None  # Stale or malformed entry (PyAudio raises OSError on bad index)
+        if device is not None and device.name == cached.get("name"):
+            return device
+
+    for device in list_devices(pa):
+        if output and device.max_output_channels <= 0:
+            continue
+        if name_lower in device.name_lower:
+            _save_device_cache(key, device)
+            return device
+    return None
@@ -2,22 +2,68 @@
 
 import logging
 import queue
-from datetime import datetime
+import threading
+import time
 from typing import List, Optional
 
+import numpy as np
 import pyaudio
 import webrtcvad
 
+from .audio_devices import find_device, get_pa
+from .events import VoiceActivityEvent
+from .ring_buffer import RingBuffer
+
 logger = logging.getLogger(__name__)
 
 
+def downmix_pcm16(data: bytes, channels: int) -> bytes:
+    """Average interleaved PCM16 channels down to mono in one vectorized pass.
+
+    Args:
+        data: Interleaved PCM16 audio
+        channels: Number of interleaved channels
+
+    Returns:
+        PCM16 mono audio data
+    """
+    frames = np.frombuffer(data, dtype=np.int16).reshape(-1, channels)
+    # Sum in int32 so the average can't overflow, then truncate back to int16
+    return (frames.sum(axis=1, dtype=np.int32) // channels).astype(np.int16).tobytes()
+
+
+def pcm16_to_float32(data: bytes, scratch: np.ndarray) -> np.ndarray:
+    """Cast PCM16 samples into a reusable float32 buffer.
+
+    A single casting copy into caller-owned memory, so per-frame analysis does
+    not allocate a new float array for every chunk.
+
+    Args:
+        data: PCM16 audio data (any bytes-like object)
+        scratch: Preallocated float32 buffer, normally one chunk long
+
+    Returns:
+        float32 view of the samples (a fresh array if scratch is too small)
+    """
+    samples = np.frombuffer(data, dtype=np.int16)
+    n = samples.size
+    if n > scratch.size:
+        return samples.astype(np.float32)
+    out = scratch[:n]
+    out[...] = samples
+    return out
+
+
 class AudioHandler:
     """Handles audio capture from AC108 device with multi-consumer support.
 
-    Uses callback-based audio capture with separate queues for different consumers:
-    - Hotword queue (small, can skip frames for responsiveness)
-    - Audio queue (large, buffers all raw audio frames for complete capture)
+    Uses callback-based audio capture with separate buffers for different consumers:
+    - Hotword ring (small, can skip frames for responsiveness)
+    - Audio ring (large, buffers all raw audio frames for complete capture)
     - Additional queues can be registered as needed
+
+    The built-in consumers use lock-free SPSC ring buffers so the PortAudio
+    callback never contends on a queue lock.
     """
 
     def __init__(
@@ -30,6 +76,7 @@ class AudioHandler:
         event_bus=None,  # Optional EventBus for voice activity events
         silence_threshold: int = 15,  # ~1 second of silence (at 80ms per chunk)
         speech_threshold: int = 3,  # Consecutive speech frames required to trigger
+        vad_energy_threshold: float = 100.0,  # RMS below this is silence (skips webrtcvad)
     ):
         """Initialize audio handler.
 
@@ -42,54 +89,77 @@ class AudioHandler:
             event_bus: Optional EventBus to publish voice activity events
             silence_threshold: Number of silent chunks before considering voice stopped
             speech_threshold: Consecutive speech frames required before considering voice started
+            vad_energy_threshold: Minimum RMS level (int16 units) below which a chunk is
+                                  treated as silence without running webrtcvad. The gate
+                                  is raised to 2x the noise floor measured over the first
+                                  2s of audio (0 disables the gate)
         """
         self.device_name = device_name
         self.sample_rate = sample_rate
         self.channels = channels
         self.chunk_size = chunk_size
 
-        # Initialize PyAudio
-        self.audio = pyaudio.PyAudio()
+        # Shared PyAudio instance (also used by SpeakerService)
+        self.audio = get_pa()
         self.stream: Optional[pyaudio.Stream] = None
 
         # Initialize VAD
         self.vad = webrtcvad.Vad(vad_aggressiveness)
+        self.vad_energy_threshold = vad_energy_threshold
+        # Energy gate compares sum(x^2) per chunk, so square the RMS threshold once
+        self._energy_gate = vad_energy_threshold**2 * chunk_size
+        self._calibration_chunks = max(1, int(2.0 * sample_rate / chunk_size))  # ~2s
+        self._calibration_energy: Optional[list[float]] = []
+        # VAD requires 10, 20, or 30ms frames - use 20ms (bytes, 16-bit)
+        self._vad_frame_bytes = int(sample_rate * 20 / 1000) * 2
+        # Reused by the energy gate instead of allocating a float array per chunk
+        self._f32_scratch = np.empty(chunk_size, dtype=np.float32)
 
         # Voice activity tracking
         self.event_bus = event_bus
         self.silence_threshold = silence_threshold
         self.speech_threshold = speech_threshold
         self.voice_active = False
-        self.voice_start_time = None
+        self._voice_start_ns = 0  # monotonic, for duration only
         self.silence_frames = 0
         self.speech_frames = 0  # Count consecutive speech frames
+        self._vad_thread: Optional[threading.Thread] = None
+        self._vad_running = False
 
-        # Multi-consumer queues
-        self.consumer_queues: List[queue.Queue] = []
-        self.hotword_queue = queue.Queue(maxsize=3)  # Small queue, can skip frames
-        self.audio_queue = queue.Queue(maxsize=100)  # Large queue, buffer all raw audio
+        # Built-in consumers: SPSC rings (capacities rounded up to a power of two)
+        frame_bytes = chunk_size * channels * 2  # PCM16
+        self.hotword_ring = RingBuffer(capacity=4, frame_bytes=frame_bytes)  # Can skip frames
+        self.audio_ring = RingBuffer(capacity=128, frame_bytes=frame_bytes)  # Buffer all audio
+        self.vad_ring = RingBuffer(capacity=16, frame_bytes=frame_bytes)  # Feeds the VAD thread
 
-        # Register default consumers
-        self.consumer_queues.append(self.hotword_queue)
-        self.consumer_queues.append(self.audio_queue)
+        # Additional registered consumer queues
+        self.consumer_queues: List[queue.Queue] = []
 
         logger.info(
             f"AudioHandler initialized: {sample_rate}Hz, {channels}ch, "
             f"chunk_size={chunk_size}, vad_aggressiveness={vad_aggressiveness}, "
             f"speech_threshold={speech_threshold} frames, "
-            f"multi-consumer mode with {len(self.consumer_queues)} queues, "
+            f"multi-consumer mode (hotword ring={self.hotword_ring.capacity}, "
+            f"audio ring={self.audio_ring.capacity}), "
             f"VAD events={'enabled' if event_bus else 'disabled'}"
         )
 
     def _audio_callback(self, in_data, frame_count, time_info, status):
         """Audio callback - called by PyAudio in background thread.
 
-        Broadcasts audio to all registered consumer queues and tracks voice activity.
+        Broadcasts audio to the rings and registered consumer queues only; voice
+        activity is tracked on a separate thread so VAD and event publishing can
+        never delay capture.
         """
         if status:
             logger.warning(f"Audio callback status: {status}")
 
-        # Broadcast to all consumer queues
+        # Broadcast to built-in rings (a full ring drops the frame - expected for
+        # the small hotword ring, which skips ahead to the latest frame)
+        self.hotword_ring.write(in_data)
+        self.audio_ring.write(in_data)
+
+        # Broadcast to registered consumer queues
         for q in self.consumer_queues:
             try:
                 q.put_nowait(in_data)
@@ -98,16 +168,27 @@ class AudioHandler:
                 # that want to skip-ahead to latest frame
                 pass
 
-        # Track voice activity if event bus is configured
+        # Hand off to the VAD thread if event bus is configured
         if self.event_bus:
-            self._track_voice_activity(in_data)
+            self.vad_ring.write(in_data)
 
         return (None, pyaudio.paContinue)
 
+    def _vad_loop(self):
+        """Run voice activity tracking on frames handed off by the audio callback."""
+        logger.debug("VAD thread started")
+
+        while self._vad_running:
+            audio_data = self.vad_ring.read(timeout=0.1)
+            if audio_data:
+                self._track_voice_activity(audio_data)
+
+        logger.debug("VAD thread stopped")
+
     def _track_voice_activity(self, audio_data: bytes):
         """Track voice activity and emit events when voice starts/stops.
 
-        Called from audio callback thread.
+        Called from the VAD thread.
 
         Args:
             audio_data: Raw audio data from callback
@@ -123,14 +204,9 @@ class AudioHandler:
                 # Voice activity started? (require speech_threshold consecutive frames)
                 if not self.voice_active and self.speech_frames >= self.speech_threshold:
                     self.voice_active = True
-                    self.voice_start_time = datetime.now()
+                    self._voice_start_ns = time.monotonic_ns()
 
-                    # Import here to avoid circular dependency
-                    from .event_bus import VoiceActivityEvent
-
-                    event = VoiceActivityEvent(
-                        timestamp=self.voice_start_time, activity_type="started"
-                    )
+                    event = VoiceActivityEvent(timestamp_ns=time.time_ns(), activity_type="started")
 
                     logger.info(
                         f"Voice activity started (after {self.speech_frames} speech frames)"
@@ -147,20 +223,17 @@ class AudioHandler:
                     # Voice activity stopped?
                     if self.silence_frames >= self.silence_threshold:
                         self.voice_active = False
-                        stop_time = datetime.now()
-                        duration = (stop_time - self.voice_start_time).total_seconds()
-
-                        # Import here to avoid circular dependency
-                        from .event_bus import VoiceActivityEvent
+                        duration = (time.monotonic_ns() - self._voice_start_ns) / 1e9
 
                         event = VoiceActivityEvent(
-                            timestamp=stop_time, activity_type="stopped", duration=duration
+                            timestamp_ns=time.time_ns(),
+                            activity_type="stopped",
+                            duration=duration,
                         )
 
                         logger.info(f"Voice activity stopped (duration: {duration:.1f}s)")
                         self.event_bus.publish("voice_activity_stopped", event)
 
-                        self.voice_start_time = None
                         self.silence_frames = 0
 
         except Exception as e:
@@ -185,6 +258,12 @@ class AudioHandler:
             stream_callback=self._audio_callback,  # Callback mode!
         )
 
+        # Start VAD thread before audio starts flowing
+        if self.event_bus:
+            self._vad_running = True
+            self._vad_thread = threading.Thread(target=self._vad_loop, daemon=True)
+            self._vad_thread.start()
+
         # Start the stream (callback will run in background)
         self.stream.start_stream()
 
@@ -198,6 +277,11 @@ class AudioHandler:
             self.stream = None
             logger.info("Audio stream stopped")
 
+        if self._vad_thread is not None:
+            self._vad_running = False
+            self._vad_thread.join(timeout=1.0)
+            self._vad_thread = None
+
     def read_hotword_chunk(self) -> Optional[bytes]:
         """Read audio chunk for hotword detection (skip-ahead behavior).
 
@@ -213,17 +297,36 @@ class AudioHandler:
 
         try:
             # Skip ahead to latest frame if we're falling behind
-            while self.hotword_queue.qsize() > 1:
-                self.hotword_queue.get_nowait()  # Discard old frame
+            self.hotword_ring.advance_reader_to_latest()
 
             # Get the most recent frame (wait up to 0.2s)
-            return self.hotword_queue.get(timeout=0.2)
-        except queue.Empty:
-            return None
+            return self.hotword_ring.read(timeout=0.2)
         except Exception as e:
             logger.error(f"Error reading hotword chunk: {e}")
             return None
 
+    def peek_hotword_chunk(self) -> Optional[memoryview]:
+        """Zero-copy variant of read_hotword_chunk().
+
+        Returns a read-only view straight into the hotword ring. The view is valid
+        until release_hotword_chunk() is called, which must follow every
+        non-None result.
+
+        Returns:
+            View of the latest PCM16 mono frame, or None if timeout
+        """
+        if self.stream is None:
+            logger.error("Audio stream not started")
+            return None
+
+        # Skip ahead to latest frame if we're falling behind
+        self.hotword_ring.advance_reader_to_latest()
+        return self.hotword_ring.peek(timeout=0.2)
+
+    def release_hotword_chunk(self):
+        """Release the frame returned by peek_hotword_chunk()."""
+        self.hotword_ring.advance()
+
     def read_audio_chunk(self, timeout: float = 0.2) -> Optional[bytes]:
         """Read audio chunk from buffered queue (complete audio capture).
 
@@ -241,13 +344,35 @@ class AudioHandler:
             return None
 
         try:
-            return self.audio_queue.get(timeout=timeout)
-        except queue.Empty:
-            return None
+            return self.audio_ring.read(timeout=timeout)
         except Exception as e:
             logger.error(f"Error reading audio chunk: {e}")
             return None
 
+    def read_audio_into(self, out: bytearray, timeout: float = 0.2) -> int:
+        """Read the next buffered frame directly into a caller-owned buffer.
+
+        Same ordering as read_audio_chunk(), but appends the frame to out in
+        place, so recorders accumulating a whole utterance avoid one bytes
+        allocation per frame and a final join.
+
+        Args:
+            out: Buffer to extend with the frame data
+            timeout: Maximum time to wait for a frame in seconds
+
+        Returns:
+            Number of bytes appended (0 on timeout or error)
+        """
+        if self.stream is None:
+            logger.error("Audio stream not started")
+            return 0
+
+        try:
+            return self.audio_ring.read_into(out, timeout=timeout)
+        except Exception as e:
+            logger.error(f"Error reading audio chunk: {e}")
+            return 0
+
     def read_chunk(self) -> Optional[bytes]:
         """Read audio chunk (backward compatible - uses hotword queue).
 
@@ -259,13 +384,9 @@ class AudioHandler:
         return self.read_hotword_chunk()
 
     def clear_audio_queue(self):
-        """Clear the audio queue (e.g., when starting new capture session)."""
-        while not self.audio_queue.empty():
-            try:
-                self.audio_queue.get_nowait()
-            except queue.Empty:
-                break
-        logger.debug("Audio queue cleared")
+        """Clear the audio ring (e.g., when starting new capture session)."""
+        dropped = self.audio_ring.clear()
+        logger.debug(f"Audio queue cleared ({dropped} frames dropped)")
 
     def register_queue(self, consumer_queue: queue.Queue):
         """Register an additional consumer queue for audio broadcast.
@@ -276,21 +397,33 @@ class AudioHandler:
         self.consumer_queues.append(consumer_queue)
         logger.info(f"Registered new consumer queue (total: {len(self.consumer_queues)})")
 
+    def unregister_queue(self, consumer_queue: queue.Queue):
+        """Stop broadcasting audio to a previously registered consumer queue.
+
+        The list is replaced rather than mutated so the audio callback never
+        iterates a list that is being modified.
+
+        Args:
+            consumer_queue: Queue previously passed to register_queue()
+        """
+        self.consumer_queues = [q for q in self.consumer_queues if q is not consumer_queue]
+        logger.info(f"Unregistered consumer queue (total: {len(self.consumer_queues)})")
+
     def convert_to_pcm16_mono(self, data: bytes) -> bytes:
         """Convert audio data to PCM16 mono format.
 
-        Since we're now using paInt16 mono directly from AC108,
-        this method simply returns the data as-is (no conversion needed).
-        Kept for backward compatibility with existing code.
+        With the default mono paInt16 stream from the AC108 this returns the data
+        as-is; multi-channel streams are downmixed with downmix_pcm16().
 
         Args:
-            data: Raw audio data (already PCM16 mono)
+            data: Raw PCM16 audio data (channels interleaved)
 
         Returns:
-            PCM16 mono audio data (same as input)
+            PCM16 mono audio data
         """
-        # No conversion needed - already in correct format!
-        return data
+        if self.channels == 1:
+            return data
+        return downmix_pcm16(data, self.channels)
 
     def is_speech(self, pcm16_data: bytes) -> bool:
         """Check if audio chunk contains speech using VAD.
@@ -302,18 +435,26 @@ class AudioHandler:
             True if speech detected, False otherwise
         """
         try:
-            # VAD requires 10, 20, or 30ms frames
-            # Our chunk may be 80ms (1280 samples), so we need to split it
-            # Split into 20ms chunks (320 samples)
-            frame_duration_ms = 20
-            frame_size = int(self.sample_rate * frame_duration_ms / 1000) * 2  # *2 for 16-bit
+            # Energy gate: quiet chunks can't be speech, skip the webrtcvad calls
+            if self.vad_energy_threshold > 0:
+                samples = pcm16_to_float32(pcm16_data, self._f32_scratch)
+                energy = float(np.dot(samples, samples))  # Single BLAS reduction
+
+                if self._calibration_energy is not None:
+                    self._calibrate_energy_gate(energy, len(samples))
+                elif energy < self._energy_gate:
+                    return False
+
+            # Our chunk may be 80ms (1280 samples), so split it into 20ms frames
+            # (320 samples) using memoryview slices - no temporary bytes objects
+            frame_size = self._vad_frame_bytes
+            view = memoryview(pcm16_data)
+            end = len(view) - frame_size + 1  # Only process full frames
 
             # Check if any sub-frame contains speech
-            for i in range(0, len(pcm16_data), frame_size):
-                frame = pcm16_data[i : i + frame_size]
-                if len(frame) == frame_size:  # Only process full frames
-                    if self.vad.is_speech(frame, self.sample_rate):
-                        return True
+            for i in range(0, end, frame_size):
+                if self.vad.is_speech(view[i : i + frame_size], self.sample_rate):
+                    return True
 
             return False
 
@@ -321,6 +462,27 @@ class AudioHandler:
             logger.error(f"VAD error: {e}")
             return False
 
+    def _calibrate_energy_gate(self, energy: float, num_samples: int):
+        """Accumulate startup energy and set the gate from the measured noise floor.
+
+        Args:
+            energy: Sum of squared samples for this chunk
+            num_samples: Number of samples in the chunk
+        """
+        self._calibration_energy.append(energy / max(num_samples, 1))
+        if len(self._calibration_energy) < self._calibration_chunks:
+            return
+
+        # Median is robust to someone talking during startup
+        noise_power = float(np.median(self._calibration_energy))
+        gate_power = max(self.vad_energy_threshold**2, 4.0 * noise_power)  # 2x noise RMS
+        self._energy_gate = gate_power * self.chunk_size
+        self._calibration_energy = None
+        logger.info(
+            f"VAD energy gate calibrated: noise RMS={noise_power**0.5:.0f}, "
+            f"gate RMS={gate_power**0.5:.0f}"
+        )
+
     def get_queue_status(self) -> dict:
         """Get status of all consumer queues (for debugging/monitoring).
 
@@ -328,9 +490,9 @@ class AudioHandler:
             Dictionary with queue sizes
         """
         return {
-            "hotword_queue": self.hotword_queue.qsize(),
-            "audio_queue": self.audio_queue.qsize(),
-            "total_consumers": len(self.consumer_queues),
+            "hotword_queue": len(self.hotword_ring),
+            "audio_queue": len(self.audio_ring),
+            "total_consumers": 2 + len(self.consumer_queues),
         }
 
     def _find_device_index(self) -> int:
@@ -342,13 +504,10 @@ class AudioHandler:
         Raises:
             RuntimeError: If device not found
         """
-        for i in range(self.audio.get_device_count()):
-            info = self.audio.get_device_info_by_index(i)
-            name = info.get("name", "").lower()
-
-            if self.device_name in name:
-                logger.info(f"Found device: {info['name']} (index {i})")
-                return i
+        device = find_device(self.audio, self.device_name)
+        if device is not None:
+            logger.info(f"Found device: {device.name} (index {device.index})")
+            return device.index
 
         # If not found by name, return default input device
         default_device = self.audio.get_default_input_device_info()
@@ -360,5 +519,5 @@ class AudioHandler:
     def cleanup(self):
         """Clean up audio resources."""
         self.stop_stream()
-        self.audio.terminate()
+        # The shared PyAudio instance is terminated at interpreter exit
         logger.info("AudioHandler cleaned up")
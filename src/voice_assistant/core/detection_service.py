@@ -2,13 +2,19 @@
 
 import logging
 import signal
+import threading
 import time
-from datetime import datetime
-from typing import Dict
+from collections import deque
+from typing import Dict, Optional
 
-from .audio_handler import AudioHandler
+import numpy as np
+
+from .audio_handler import AudioHandler, pcm16_to_float32
 from .event_bus import EventBus, HotwordEvent
 from .hotword_detector import HotwordDetector
+from .hotword_process import HotwordProcess
+from .ring_buffer import RingBuffer
+from .thread_priority import boost_current_thread
 
 logger = logging.getLogger(__name__)
 
@@ -22,25 +28,51 @@ class VoiceDetectionService:
     3. Publishes hotword events (max once per cooldown period)
 
     Voice activity events are published automatically by AudioHandler.
+    Frames are scored on a separate inference thread fed through a small ring
+    (or, with inference_process=True, in a child process fed through shared
+    memory), so model latency spikes never stall reading audio.
 
     Commands can use this service to build different functionality
     without duplicating the detection logic.
     """
 
+    # CPU core for the inference thread (collection uses 2, playback uses 3)
+    THREAD_CPU = 1
+
     def __init__(
         self,
         audio_handler: AudioHandler,
         event_bus: EventBus,
         hotword_detector: HotwordDetector,
         hotword_cooldown: float = 2.0,  # Seconds to wait before next hotword detection
+        silence_filter: bool = False,  # Defer hotword scoring of silent frames
+        silence_rms: float = 50.0,  # Minimum RMS gate (int16 units)
+        silence_entropy: float = 0.85,  # Normalized spectral entropy at/above which = noise
+        admission_frames: int = 12,  # Frames admitted unconditionally after non-silence
+        inference_process: bool = False,  # Score in a child process instead of a thread
     ):
         """Initialize detection service.
 
         Args:
             audio_handler: Audio handler for reading audio
             event_bus: Event bus for publishing events
-            hotword_detector: Hotword detector instance
+            hotword_detector: Hotword detector. With inference_process it only supplies
+                              the model settings, so it can be created with
+                              load_model=False; it is loaded here if the child dies.
             hotword_cooldown: Seconds to wait after hotword detection before detecting again
+            silence_filter: If True, frames that are both quiet and noise-like are held
+                            back from the hotword model; up to admission_frames of
+                            them are fed along with the next admitted frame, so the
+                            model's streaming context stays intact
+            silence_rms: Minimum RMS below which a frame may be silent. Raised to twice
+                         the median RMS of the first ~2s (noise floor calibration)
+            silence_entropy: Normalized spectral entropy (0-1) at or above which a quiet
+                             frame is treated as noise rather than speech
+            admission_frames: Number of frames scored unconditionally after a non-silent
+                              frame, so word onsets and tails reach the model
+            inference_process: If True, load the hotword model in a child process fed
+                               through shared memory (HotwordProcess), so inference runs
+                               on another core without holding this process's GIL
         """
         self.audio_handler = audio_handler
         self.event_bus = event_bus
@@ -48,8 +80,32 @@ class VoiceDetectionService:
         self.hotword_cooldown = hotword_cooldown
         self.running = False
 
-        # Track last detection time for each hotword model (debouncing)
-        self.last_detection_time: Dict[str, float] = {}
+        # Debouncing: monotonic ns before which each hotword model is ignored
+        self._cooldown_ns = int(hotword_cooldown * 1e9)
+        self._ready_after: Dict[str, int] = {}
+
+        # Silence admission filter
+        self.silence_filter = silence_filter
+        self.silence_entropy = silence_entropy
+        self.admission_frames = admission_frames
+        self._rms_gate = silence_rms
+        self._admit_remaining = 0
+        self._held_frames: deque[bytes] = deque(maxlen=admission_frames)
+        chunk_seconds = audio_handler.chunk_size / audio_handler.sample_rate
+        self._calibration_frames = max(1, int(2.0 / chunk_seconds))  # ~2s
+        self._calibration_rms: Optional[list[float]] = []
+        self._f32_scratch = np.empty(audio_handler.chunk_size, dtype=np.float32)
+
+        # Hand-off from the read loop to the inference thread: ~320ms of slack
+        # plus room for the held-back frames flushed along with an admitted frame
+        self._inference_ring = RingBuffer(
+            capacity=admission_frames + 4 if silence_filter else 4,
+            frame_bytes=audio_handler.chunk_size * 2,  # PCM16 mono
+        )
+        self._inference_thread: Optional[threading.Thread] = None
+        self.inference_process = inference_process
+        self._hotword_process: Optional[HotwordProcess] = None
+        self._hand_off = self._inference_ring.write  # Where the read loop puts frames
 
         logger.info(f"VoiceDetectionService initialized (hotword_cooldown={hotword_cooldown}s)")
 
@@ -58,7 +114,7 @@ class VoiceDetectionService:
 
         This method blocks until stop() is called or a signal is received.
         Voice activity events are emitted automatically by AudioHandler.
-        Hotword events are emitted by this loop.
+        Hotword events are emitted by the inference thread this loop feeds.
         """
         if self.running:
             logger.warning("Service already running")
@@ -76,50 +132,80 @@ class VoiceDetectionService:
 
         logger.info("Starting detection loop...")
 
+        # Scoring runs on its own thread (or process) so inference jitter never
+        # delays audio reads
+        if self.inference_process:
+            self._hotword_process = HotwordProcess(
+                model_name=self.hotword_detector.model_name,
+                threshold=self.hotword_detector.threshold,
+                frame_bytes=self._inference_ring.frame_bytes,
+                capacity=self._inference_ring.capacity,
+                use_int8=self.hotword_detector.use_int8,
+                num_threads=self.hotword_detector.num_threads,
+            )
+            self._hotword_process.start()
+            self._hand_off = self._hotword_process.submit
+            target = self._process_results_loop
+        else:
+            self.hotword_detector.load()
+            self._inference_ring.clear()
+            self._hand_off = self._inference_ring.write
+            target = self._inference_loop
+        self._inference_thread = threading.Thread(
+            target=target, name="hotword-inference", daemon=True
+        )
+        self._inference_thread.start()
+
+        # Bind per-frame calls once; mono input needs no conversion at all
+        peek_chunk = self.audio_handler.peek_hotword_chunk
+        release_chunk = self.audio_handler.release_hotword_chunk
+        convert = (
+            None if self.audio_handler.channels == 1 else self.audio_handler.convert_to_pcm16_mono
+        )
+
+        held = self._held_frames
+
+        # Previous frame, to catch buffers PortAudio repeats on underrun
+        last_view = memoryview(bytearray(self._inference_ring.frame_bytes))
+        last_len = 0
+        duplicates = 0
+
         try:
             while self.running:
-                # Get latest audio for hotword detection (skip-ahead queue)
-                audio_data = self.audio_handler.read_hotword_chunk()
-
-                if audio_data:
-                    # Check for hotword
-                    pcm16_data = self.audio_handler.convert_to_pcm16_mono(audio_data)
-                    scores = self.hotword_detector.get_scores(pcm16_data)
-
-                    for model_name, score in scores.items():
-                        if score >= self.hotword_detector.threshold:
-                            # Check debouncing - has enough time passed since last detection?
-                            current_time = time.time()
-                            last_time = self.last_detection_time.get(model_name, 0)
-                            time_since_last = current_time - last_time
-
-                            if time_since_last < self.hotword_cooldown:
-                                # Still in cooldown period, skip this detection
-                                logger.debug(
-                                    f"Hotword '{model_name}' detected (score: {score:.3f}) but in"
-                                    f" cooldown ({time_since_last:.2f}s "
-                                    f"< {self.hotword_cooldown}s), skipping"
-                                )
-                                continue
-
-                            # Cooldown passed - publish event!
-                            self.last_detection_time[model_name] = current_time
-                            queue_status = self.audio_handler.get_queue_status()
-
-                            event = HotwordEvent(
-                                timestamp=datetime.now(),
-                                hotword=model_name,
-                                score=score,
-                                audio_queue_size=queue_status["audio_queue"],
-                            )
-
-                            logger.info(f"Hotword '{model_name}' detected! Score: {score:.3f}")
-
-                            # Publish event - consumers will handle it
-                            self.event_bus.publish("hotword_detected", event)
-
-                            # Brief pause
-                            time.sleep(0.1)
+                # View of the latest audio for hotword detection (skip-ahead ring).
+                # The frame is only copied once, into the inference ring.
+                audio_data = peek_chunk()
+                if audio_data is None:
+                    continue
+
+                try:
+                    pcm16_data = audio_data if convert is None else convert(audio_data)
+
+                    # A bit-identical repeat carries no new audio. The model is
+                    # streaming (scores depend on history), so drop the frame rather
+                    # than replaying cached scores or feeding it twice.
+                    n = len(pcm16_data)
+                    if n == last_len and pcm16_data == last_view[:n]:
+                        duplicates += 1
+                        if duplicates & (duplicates - 1) == 0:  # Log at 1, 2, 4, 8...
+                            logger.debug(f"Skipped {duplicates} repeated audio frame(s)")
+                        continue
+                    last_view[:n] = pcm16_data
+                    last_len = n
+
+                    # Re-read per frame: switches to the thread if the child dies
+                    hand_off = self._hand_off
+                    if not self.silence_filter:
+                        hand_off(pcm16_data)
+                    elif self._admit(pcm16_data):
+                        # Lead-in the filter held back goes first, in order
+                        while held:
+                            hand_off(held.popleft())
+                        hand_off(pcm16_data)
+                    else:
+                        held.append(bytes(pcm16_data))  # The ring slot is reused
+                finally:
+                    release_chunk()
 
         except KeyboardInterrupt:
             logger.info("Interrupted by user")
@@ -128,8 +214,184 @@ class VoiceDetectionService:
             raise
         finally:
             self.running = False
+            if self._inference_thread:
+                self._inference_thread.join(timeout=1.0)
+                self._inference_thread = None
+            if self._hotword_process:
+                self._hotword_process.stop()
+                self._hotword_process = None
             logger.info("Detection loop stopped")
 
+    def _inference_loop(self):
+        """Score queued frames and publish hotword events (inference thread)."""
+        boost_current_thread("hotword-inference", cpu=self.THREAD_CPU, priority=10)
+        ring = self._inference_ring
+        stream_feed = self.hotword_detector.stream_feed
+
+        # Backlogged frames are joined here and scored in one predict() call
+        batch_view = memoryview(bytearray(ring.capacity * ring.frame_bytes))
+
+        while self.running:
+            # Score straight out of the ring slot (no copy)
+            pcm16_data = ring.peek(timeout=0.2)
+            if pcm16_data is None:
+                continue
+
+            backlog = len(ring)
+            if backlog > 1:
+                # Behind: score every pending frame at once instead of dropping
+                # them. openWakeWord steps through each 80ms hop of a longer
+                # input and reports the best score, with one feature/model call.
+                pos = 0
+                for _ in range(backlog):
+                    frame = ring.peek(timeout=0)
+                    end = pos + len(frame)
+                    batch_view[pos:end] = frame
+                    pos = end
+                    ring.advance()
+                pcm16_data = batch_view[:pos]
+                logger.debug(f"Hotword inference behind, scoring {backlog} frames together")
+
+            try:
+                hits = stream_feed(pcm16_data)
+            except Exception as e:
+                logger.error(f"Error scoring hotword frame: {e}", exc_info=True)
+                continue
+            finally:
+                if backlog <= 1:
+                    ring.advance()
+
+            # Almost every frame has no hits
+            if not hits:
+                continue
+
+            # One clock read per frame; monotonic so cooldowns survive clock jumps
+            now_ns = time.monotonic_ns()
+            for model_name, score in hits:
+                self._on_hit(model_name, score, now_ns)
+
+        logger.debug("Hotword inference thread stopped")
+
+    def _process_results_loop(self):
+        """Publish hits reported by the inference process (results thread)."""
+        process = self._hotword_process
+        while self.running:
+            hits = process.get_hits(timeout=0.2)
+            if not hits:
+                if not process.is_alive():
+                    self._fall_back_to_thread(process.exitcode)
+                    return
+                continue
+            now_ns = time.monotonic_ns()
+            for model_name, score in hits:
+                self._on_hit(model_name, score, now_ns)
+
+        logger.debug("Hotword results thread stopped")
+
+    def _fall_back_to_thread(self, exitcode: Optional[int]):
+        """Score in this process after the inference child has died (results thread).
+
+        The child is left for stop() to clean up, so a frame the read loop is
+        still handing to it never meets a closed ring.
+
+        Args:
+            exitcode: Exit code of the child process
+        """
+        logger.error(
+            f"Hotword inference process exited (exit code {exitcode}), "
+            "falling back to in-process inference"
+        )
+        try:
+            self.hotword_detector.load()
+        except Exception as e:
+            logger.error(f"Hotword detection stopped: model failed to load ({e})")
+            return
+        self._inference_ring.clear()  # Nothing reads it yet; this thread becomes its reader
+        self._hand_off = self._inference_ring.write
+        self._inference_loop()
+
+    def _on_hit(self, model_name: str, score: float, now_ns: int):
+        """Debounce a score above threshold and publish a hotword event.
+
+        Args:
+            model_name: Hotword model that fired
+            score: Detection score
+            now_ns: time.monotonic_ns() when the frame was scored
+        """
+        # Check debouncing - still inside the cooldown window?
+        ready_after = self._ready_after.get(model_name, 0)
+        if now_ns < ready_after:
+            # Still in cooldown period, skip this detection
+            logger.debug(
+                f"Hotword '{model_name}' detected (score: {score:.3f}) but in"
+                f" cooldown ({(ready_after - now_ns) / 1e9:.2f}s left), skipping"
+            )
+            return
+
+        # Cooldown passed - publish event!
+        queue_status = self.audio_handler.get_queue_status()
+
+        event = HotwordEvent(
+            timestamp_ns=time.time_ns(),
+            hotword=model_name,
+            score=score,
+            audio_queue_size=queue_status["audio_queue"],
+        )
+
+        # Publish unless consumers are still handling the previous hotword. The
+        # cooldown only starts once published, so the next frame above threshold
+        # retries instead of the loop sleeping.
+        if self.event_bus.publish_if_idle("hotword_detected", event):
+            self._ready_after[model_name] = now_ns + self._cooldown_ns
+            logger.info(f"Hotword '{model_name}' detected! Score: {score:.3f}")
+
+    def _admit(self, pcm16_data: bytes) -> bool:
+        """Decide whether a frame should be scored by the hotword model.
+
+        A frame is held back only if it is quiet (RMS under the calibrated gate) and
+        its spectrum is flat (high spectral entropy, i.e. noise rather than voice).
+        Any other frame opens an admission window of admission_frames frames.
+
+        Args:
+            pcm16_data: PCM16 mono audio data
+
+        Returns:
+            True if the frame should be scored
+        """
+        samples = pcm16_to_float32(pcm16_data, self._f32_scratch)
+        if samples.size == 0:
+            return False
+        rms = float(np.sqrt(np.dot(samples, samples) / samples.size))
+
+        if self._calibration_rms is not None:
+            # Score everything while measuring the noise floor
+            self._calibration_rms.append(rms)
+            if len(self._calibration_rms) >= self._calibration_frames:
+                # Median, so one click or word during startup can't lift the gate
+                # to speech level; 2x the noise RMS like the VAD energy gate
+                noise_rms = float(np.median(self._calibration_rms))
+                self._rms_gate = max(self._rms_gate, 2.0 * noise_rms)
+                self._calibration_rms = None
+                logger.info(f"Hotword silence gate calibrated: RMS < {self._rms_gate:.1f}")
+            return True
+
+        if rms < self._rms_gate:
+            spectrum = np.abs(np.fft.rfft(samples))
+            total = spectrum.sum()
+            if total > 0:
+                p = spectrum[spectrum > 0] / total
+                entropy = float(-np.dot(p, np.log(p)) / np.log(spectrum.size))
+            else:
+                entropy = 1.0  # Digital silence
+            if entropy >= self.silence_entropy:
+                if self._admit_remaining > 0:
+                    self._admit_remaining -= 1
+                    return True
+                return False
+
+        self._admit_remaining = self.admission_frames
+        return True
+
     def stop(self):
         """Stop the detection loop."""
         self.running = False
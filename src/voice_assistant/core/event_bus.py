@@ -2,47 +2,36 @@
 
 import logging
 import threading
-from dataclasses import dataclass
-from datetime import datetime
-from typing import Any, Callable, Dict, List
-
-logger = logging.getLogger(__name__)
-
-
-@dataclass
-class HotwordEvent:
-    """Event emitted when hotword is detected."""
-
-    timestamp: datetime
-    hotword: str
-    score: float
-    audio_queue_size: int  # How many frames are in queue at detection time
-
-
-@dataclass
-class VoiceActivityEvent:
-    """Event emitted when voice activity starts or stops."""
-
-    timestamp: datetime
-    activity_type: str  # 'started' or 'stopped'
-    duration: float = 0.0  # Duration in seconds (only for 'stopped')
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Tuple
 
+# Event types live in .events (no dependencies); re-exported here for existing imports
+from .events import HotwordEvent, SpeakingFinishedEvent, VoiceActivityEvent
 
-@dataclass
-class SpeakingFinishedEvent:
-    """Event emitted when speaker has finished playing all audio."""
+logger = logging.getLogger(__name__)
 
-    timestamp: datetime
+__all__ = ["EventBus", "HotwordEvent", "SpeakingFinishedEvent", "VoiceActivityEvent"]
 
 
 class EventBus:
     """Simple event bus for pub-sub communication between components."""
 
-    def __init__(self):
-        """Initialize event bus."""
-        self._subscribers: Dict[str, List[Callable]] = {}
+    def __init__(self, max_workers: int = 8):
+        """Initialize event bus.
+
+        Args:
+            max_workers: Size of the persistent callback thread pool. Some subscribers
+                         block for seconds (e.g. transcription), so leave headroom for
+                         the other events to keep flowing.
+        """
+        # Copy-on-write: writers rebind a new dict of tuples under the lock, so
+        # publish() can read a consistent snapshot without locking
+        self._subscribers: Dict[str, Tuple[Callable, ...]] = {}
         self._lock = threading.Lock()
-        logger.info("EventBus initialized")
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="eventbus")
+        # Callbacks still running for the last publish_if_idle() of each event type
+        self._pending: Dict[str, List[Future]] = {}
+        logger.info(f"EventBus initialized (max_workers={max_workers})")
 
     def subscribe(self, event_type: str, callback: Callable[[Any], None]):
         """Subscribe to an event type.
@@ -52,14 +41,9 @@ class EventBus:
             callback: Function to call when event is published
         """
         with self._lock:
-            if event_type not in self._subscribers:
-                self._subscribers[event_type] = []
-
-            self._subscribers[event_type].append(callback)
-            logger.info(
-                f"Subscribed to '{event_type}' "
-                f"(total subscribers: {len(self._subscribers[event_type])})"
-            )
+            callbacks = self._subscribers.get(event_type, ()) + (callback,)
+            self._subscribers = {**self._subscribers, event_type: callbacks}
+            logger.info(f"Subscribed to '{event_type}' (total subscribers: {len(callbacks)})")
 
     def unsubscribe(self, event_type: str, callback: Callable[[Any], None]):
         """Unsubscribe from an event type.
@@ -69,12 +53,13 @@ class EventBus:
             callback: Callback function to remove
         """
         with self._lock:
-            if event_type in self._subscribers:
-                try:
-                    self._subscribers[event_type].remove(callback)
-                    logger.info(f"Unsubscribed from '{event_type}'")
-                except ValueError:
-                    pass
+            callbacks = list(self._subscribers.get(event_type, ()))
+            try:
+                callbacks.remove(callback)
+            except ValueError:
+                return
+            self._subscribers = {**self._subscribers, event_type: tuple(callbacks)}
+            logger.info(f"Unsubscribed from '{event_type}'")
 
     def publish(self, event_type: str, event_data: Any):
         """Publish an event to all subscribers.
@@ -83,20 +68,54 @@ class EventBus:
             event_type: Type of event to publish
             event_data: Event data to pass to subscribers
         """
+        self._dispatch(event_type, event_data)
+
+    def publish_if_idle(self, event_type: str, event_data: Any) -> bool:
+        """Publish an event unless subscribers are still handling the previous one.
+
+        Only events published through this method are tracked, so plain
+        publish() stays lock-free.
+
+        Args:
+            event_type: Type of event to publish
+            event_data: Event data to pass to subscribers
+
+        Returns:
+            True if published, False if the previous event of this type is still
+            being handled (the caller may retry)
+        """
         with self._lock:
-            subscribers = self._subscribers.get(event_type, []).copy()
+            pending = self._pending.get(event_type)
+            if pending and not all(future.done() for future in pending):
+                logger.debug(f"Subscribers still handling '{event_type}', not publishing")
+                return False
+            self._pending[event_type] = self._dispatch(event_type, event_data)
+        return True
+
+    def _dispatch(self, event_type: str, event_data: Any) -> List[Future]:
+        """Submit every subscriber callback for an event to the pool.
+
+        Args:
+            event_type: Type of event to publish
+            event_data: Event data to pass to subscribers
+
+        Returns:
+            Futures of the submitted callbacks
+        """
+        subscribers = self._subscribers.get(event_type, ())
 
         if not subscribers:
             logger.debug(f"No subscribers for event '{event_type}'")
-            return
+            return []
 
         logger.info(f"Publishing '{event_type}' to {len(subscribers)} subscriber(s)")
 
-        # Call subscribers in separate threads to avoid blocking
-        for callback in subscribers:
-            threading.Thread(
-                target=self._safe_callback, args=(callback, event_data, event_type), daemon=True
-            ).start()
+        # Call subscribers on pool threads to avoid blocking the publisher
+        submit = self._executor.submit
+        return [
+            submit(self._safe_callback, callback, event_data, event_type)
+            for callback in subscribers
+        ]
 
     def _safe_callback(self, callback: Callable, event_data: Any, event_type: str):
         """Call subscriber callback with error handling.
@@ -120,5 +139,9 @@ class EventBus:
         Returns:
             Number of subscribers
         """
-        with self._lock:
-            return len(self._subscribers.get(event_type, []))
+        return len(self._subscribers.get(event_type, ()))
+
+    def close(self):
+        """Stop the callback pool (callbacks already running are not waited for)."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        logger.info("EventBus closed")
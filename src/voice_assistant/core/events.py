@@ -0,0 +1,50 @@
+"""Event types published on the event bus.
+
+Kept free of intra-package imports so any module (including the audio
+callback path) can import them at module load without circular imports.
+
+Events carry a wall-clock ``timestamp_ns`` from time.time_ns(), which is much
+cheaper to take than datetime.now(); the ``timestamp`` property converts it to
+a datetime only when something (usually logging) asks for it.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from functools import cached_property
+
+
+class _Timestamped:
+    """Mixin adding a lazily converted datetime for timestamp_ns."""
+
+    timestamp_ns: int
+
+    @cached_property
+    def timestamp(self) -> datetime:
+        """Event time as a local datetime."""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9)
+
+
+@dataclass
+class HotwordEvent(_Timestamped):
+    """Event emitted when hotword is detected."""
+
+    timestamp_ns: int  # time.time_ns()
+    hotword: str
+    score: float
+    audio_queue_size: int  # How many frames are in queue at detection time
+
+
+@dataclass
+class VoiceActivityEvent(_Timestamped):
+    """Event emitted when voice activity starts or stops."""
+
+    timestamp_ns: int  # time.time_ns()
+    activity_type: str  # 'started' or 'stopped'
+    duration: float = 0.0  # Duration in seconds (only for 'stopped')
+
+
+@dataclass
+class SpeakingFinishedEvent(_Timestamped):
+    """Event emitted when speaker has finished playing all audio."""
+
+    timestamp_ns: int  # time.time_ns()
@@ -1,13 +1,126 @@
 """Hotword detection using openWakeWord."""
 
+import functools
 import logging
+import os
+from typing import List, Optional, Tuple
 
 import numpy as np
+import openwakeword
 from openwakeword.model import Model
 
+# Optional: int8 quantization of the ONNX models
+try:
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    HAS_ORT_QUANTIZATION = True
+except ImportError:
+    HAS_ORT_QUANTIZATION = False
+
+# Optional: XNNPACK (NEON-optimized kernels) for the ONNX sessions
+try:
+    import onnxruntime as ort
+
+    HAS_ORT_XNNPACK = "XnnpackExecutionProvider" in ort.get_available_providers()
+except ImportError:
+    HAS_ORT_XNNPACK = False
+
 logger = logging.getLogger(__name__)
 
 
+def _quantize_int8(fp32_path: str) -> str:
+    """Get the path of an int8-quantized copy of an ONNX model, creating it once.
+
+    Args:
+        fp32_path: Path to the FP32 .onnx model
+
+    Returns:
+        Path to the quantized model (stored next to the FP32 model)
+    """
+    if not HAS_ORT_QUANTIZATION:
+        raise ImportError("int8 hotword models require onnxruntime (pip install onnxruntime)")
+
+    int8_path = fp32_path.removesuffix(".onnx") + "_int8.onnx"
+    if not os.path.exists(int8_path):
+        logger.info(f"Quantizing {fp32_path} to int8...")
+        quantize_dynamic(fp32_path, int8_path, weight_type=QuantType.QInt8)
+    return int8_path
+
+
+def _int8_model_path(model_name: str) -> str:
+    """Get the path of an int8-quantized ONNX wake word model, creating it once.
+
+    Args:
+        model_name: Pre-trained model name (e.g. 'alexa') or path to an .onnx model
+
+    Returns:
+        Path to the quantized model (stored next to the FP32 model)
+    """
+    if os.path.isfile(model_name):
+        fp32_path = model_name
+    else:
+        fp32_path = next(
+            (
+                path
+                for path in openwakeword.get_pretrained_model_paths(inference_framework="onnx")
+                if os.path.basename(path).startswith(model_name)
+            ),
+            None,
+        )
+        if fp32_path is None:
+            raise FileNotFoundError(f"No ONNX model found for '{model_name}'")
+    return _quantize_int8(fp32_path)
+
+
+def _int8_embedding_path() -> str:
+    """Get the path of an int8-quantized copy of the shared speech embedding model.
+
+    The embedding CNN runs on every frame for every wake word, so it is where
+    most of the hotword CPU time goes. The melspectrogram front end stays FP32.
+
+    Returns:
+        Path to the quantized embedding model
+    """
+    tflite_path = openwakeword.FEATURE_MODELS["embedding"]["model_path"]
+    return _quantize_int8(tflite_path.removesuffix(".tflite") + ".onnx")
+
+
+def _use_xnnpack(model: Model, wakeword_path: str, embedding_path: str, num_threads: int):
+    """Rebuild an ONNX openWakeWord Model's sessions on the XNNPACK provider.
+
+    openWakeWord always creates plain CPUExecutionProvider sessions, so they
+    are replaced after construction. XNNPACK runs its own thread pool, so the
+    session's intra-op pool is kept at one thread.
+
+    Args:
+        model: Model loaded with inference_framework="onnx"
+        wakeword_path: Path of the (single) wake word .onnx model
+        embedding_path: Path of the embedding .onnx model
+        num_threads: XNNPACK thread count
+    """
+    options = ort.SessionOptions()
+    options.intra_op_num_threads = 1
+    options.inter_op_num_threads = 1
+    options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+    providers = [
+        ("XnnpackExecutionProvider", {"intra_op_num_threads": num_threads}),
+        "CPUExecutionProvider",
+    ]
+
+    def session(path: str) -> "ort.InferenceSession":
+        return ort.InferenceSession(path, sess_options=options, providers=providers)
+
+    # The preprocessor's predict lambdas look the sessions up on each call
+    melspec_path = openwakeword.FEATURE_MODELS["melspectrogram"]["model_path"]
+    model.preprocessor.melspec_model = session(melspec_path.removesuffix(".tflite") + ".onnx")
+    model.preprocessor.embedding_model = session(embedding_path)
+
+    name = next(iter(model.models))
+    model.models[name] = session(wakeword_path)
+    predict = model.model_prediction_function[name]
+    model.model_prediction_function[name] = functools.partial(predict.func, model.models[name])
+
+
 class HotwordDetector:
     """Detects 'alexa' hotword using openWakeWord."""
 
@@ -16,6 +129,9 @@ class HotwordDetector:
         model_name: str = "alexa",
         threshold: float = 0.5,
         sample_rate: int = 16000,
+        use_int8: bool = False,
+        num_threads: int = 1,
+        load_model: bool = True,
     ):
         """Initialize hotword detector.
 
@@ -23,20 +139,85 @@ class HotwordDetector:
             model_name: Name of the wake word model
             threshold: Detection threshold (0.0-1.0)
             sample_rate: Audio sample rate in Hz
+            use_int8: Run int8-quantized ONNX copies of the wake word and
+                      embedding models (dynamic quantization, created on first
+                      use). Falls back to the default FP32 models if
+                      quantization is unavailable.
+            num_threads: Threads for the melspectrogram and embedding models
+                         (TFLite interpreter or ONNX Runtime session)
+            load_model: Load the model now. Pass False when only the settings are
+                        needed (e.g. scoring in a HotwordProcess); call load() if
+                        it has to run in this process after all.
         """
         self.model_name = model_name
         self.threshold = threshold
         self.sample_rate = sample_rate
+        self.use_int8 = use_int8
+        self.num_threads = num_threads
+
+        # Model names in prediction order (cached for get_scores_array)
+        self._score_names: tuple[str, ...] | None = None
+        # Prediction key when exactly one model is loaded (set on first prediction)
+        self._target_key: Optional[str] = None
+
+        self.model: Optional[Model] = None
+        if load_model:
+            self.load()
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the openWakeWord model has been loaded."""
+        return self.model is not None
+
+    def load(self):
+        """Load (and warm up) the openWakeWord model; a no-op once loaded."""
+        if self.model is not None:
+            return
+
+        if self.use_int8:
+            try:
+                int8_path = _int8_model_path(self.model_name)
+                embedding_path = _int8_embedding_path()
+                self.model = Model(
+                    wakeword_models=[int8_path],
+                    inference_framework="onnx",
+                    embedding_model_path=embedding_path,
+                    ncpu=self.num_threads,
+                )
+                if HAS_ORT_XNNPACK:
+                    _use_xnnpack(self.model, int8_path, embedding_path, self.num_threads)
+                    logger.info("Hotword ONNX sessions using XNNPACK")
+                logger.info(f"Loaded int8 hotword model: {int8_path}")
+                self._warm_up()
+                return
+            except Exception as e:
+                logger.warning(f"int8 hotword model unavailable ({e}), using FP32 model")
+                self.use_int8 = False
 
-        # Initialize openWakeWord model
         try:
             # Load the pre-trained alexa model
             # openWakeWord will download the model automatically on first use
-            self.model = Model(wakeword_models=[model_name])
-            logger.info(f"Loaded hotword model: {model_name}")
+            # (TFLite when tflite-runtime is installed, otherwise ONNX)
+            self.model = Model(wakeword_models=[self.model_name], ncpu=self.num_threads)
+            logger.info(f"Loaded hotword model: {self.model_name}")
         except Exception as e:
             logger.error(f"Failed to load hotword model: {e}")
             raise
+        self._warm_up()
+
+    def _warm_up(self, frames: int = 3):
+        """Run a few silent frames through the model, then clear its state.
+
+        The first predict() calls pay for inference arena allocation and thread
+        pool start-up; doing that here keeps it off the first live frame.
+
+        Args:
+            frames: Number of 80ms frames to run
+        """
+        silence = np.zeros(1280, dtype=np.int16)
+        for _ in range(frames):
+            self.model.predict(silence)
+        self.model.reset()
 
     def detect(self, audio_data: bytes) -> bool:
         """Detect hotword in audio chunk.
@@ -47,25 +228,13 @@ class HotwordDetector:
         Returns:
             True if hotword detected, False otherwise
         """
-        try:
-            # Convert bytes to numpy array (int16)
-            # Pass int16 directly to model - this is the official openWakeWord method
-            audio_array = np.frombuffer(audio_data, dtype=np.int16)
-
-            # Predict on audio chunk (openWakeWord handles normalization internally)
-            predictions = self.model.predict(audio_array)
-
-            # Check if any model score exceeds threshold
-            for model_name, score in predictions.items():
-                if score >= self.threshold:
-                    logger.info(f"Hotword '{model_name}' detected! Score: {score:.3f}")
-                    return True
-
+        hits = self.stream_feed(audio_data)
+        if not hits:
             return False
 
-        except Exception as e:
-            logger.error(f"Error in hotword detection: {e}")
-            return False
+        model_name, score = hits[0]
+        logger.info(f"Hotword '{model_name}' detected! Score: {score:.3f}")
+        return True
 
     def get_scores(self, audio_data: bytes) -> dict:
         """Get detection scores for audio chunk (for debugging).
@@ -90,6 +259,63 @@ class HotwordDetector:
             logger.error(f"Error getting scores: {e}")
             return {}
 
+    def get_scores_array(
+        self, audio_data: bytes | memoryview
+    ) -> tuple[tuple[str, ...], np.ndarray]:
+        """Get detection scores as a parallel (names, scores) pair.
+
+        Lets callers threshold all models with one vectorized comparison and only
+        touch the names of models that fired.
+
+        Args:
+            audio_data: PCM16 mono audio data (any bytes-like object; read in place)
+
+        Returns:
+            Tuple of (model names, float32 score array); both empty on error
+        """
+        try:
+            audio_array = np.frombuffer(audio_data, dtype=np.int16)
+            predictions = self.model.predict(audio_array)
+
+            names = self._score_names
+            if names is None or len(names) != len(predictions):
+                names = self._score_names = tuple(predictions)
+                self._target_key = names[0] if len(names) == 1 else None
+            scores = np.fromiter(predictions.values(), dtype=np.float32, count=len(names))
+            return names, scores
+
+        except Exception as e:
+            logger.error(f"Error getting scores: {e}")
+            return (), np.empty(0, dtype=np.float32)
+
+    def stream_feed(self, audio_data: bytes | memoryview) -> Optional[List[Tuple[str, float]]]:
+        """Feed the next frame of the live stream and return any detections.
+
+        openWakeWord keeps the rolling audio/feature context between calls, so
+        callers just pump consecutive frames in order. The frame is read in place.
+
+        Args:
+            audio_data: Next PCM16 mono frame of the stream
+
+        Returns:
+            List of (model name, score) pairs at or above threshold, or None
+        """
+        key = self._target_key
+        if key is not None:
+            # Single model: one dict lookup instead of building a score array
+            try:
+                score = self.model.predict(np.frombuffer(audio_data, dtype=np.int16))[key]
+            except Exception as e:
+                logger.error(f"Error getting scores: {e}")
+                return None
+            return [(key, float(score))] if score >= self.threshold else None
+
+        names, scores = self.get_scores_array(audio_data)
+        hits = np.flatnonzero(scores >= self.threshold)
+        if hits.size == 0:
+            return None
+        return [(names[i], float(scores[i])) for i in hits]
+
     def reset(self):
         """Reset the hotword detector state."""
         try:
@@ -0,0 +1,170 @@
+"""Hotword inference in a child process, fed through shared memory."""
+
+import logging
+import multiprocessing
+import queue
+from typing import List, Optional, Tuple
+
+from .shared_ring import SharedAudioRing
+from .thread_priority import boost_current_thread
+
+logger = logging.getLogger(__name__)
+
+
+def _inference_worker(
+    ring_name: str,
+    model_name: str,
+    threshold: float,
+    use_int8: bool,
+    num_threads: int,
+    results: multiprocessing.Queue,
+    stop_event,
+):
+    """Child process entry point: score frames from the ring and report hits.
+
+    Args:
+        ring_name: Name of the SharedAudioRing carrying PCM16 mono frames
+        model_name: openWakeWord model to load
+        threshold: Detection threshold (0.0-1.0)
+        use_int8: Load the int8-quantized model
+        num_threads: Threads for the melspectrogram and embedding models
+        results: Queue receiving lists of (model name, score) hits
+        stop_event: Set by the parent to stop the worker
+    """
+    # Imported here so only the child loads the model runtime
+    from .hotword_detector import HotwordDetector
+
+    # Load and warm up before boosting: the ONNX Runtime / XNNPACK worker
+    # threads are created here and would otherwise inherit the pin and SCHED_FIFO
+    detector = HotwordDetector(
+        model_name=model_name, threshold=threshold, use_int8=use_int8, num_threads=num_threads
+    )
+    ring = SharedAudioRing.attach(ring_name)
+
+    # Same core and priority as the in-process inference thread (scoring thread only)
+    boost_current_thread("hotword-process", cpu=HotwordProcess.THREAD_CPU, priority=10)
+
+    try:
+        while not stop_event.is_set():
+            pcm16_data = ring.read(timeout=0.2)
+            if pcm16_data is None:
+                continue
+
+            # Behind: score the backlog (up to 4 frames) in one predict() call
+            frames = [pcm16_data]
+            while len(frames) < 4 and (frame := ring.read_nowait()) is not None:
+                frames.append(frame)
+            if len(frames) > 1:
+                pcm16_data = b"".join(frames)
+
+            hits = detector.stream_feed(pcm16_data)
+            if hits:
+                results.put(hits)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        ring.close()
+
+
+class HotwordProcess:
+    """Runs hotword scoring in a separate process so it never competes for the GIL.
+
+    Frames go to the child through a SharedAudioRing (no pickling). Only the
+    rare hits come back, as small (model name, score) lists on a
+    multiprocessing queue.
+    """
+
+    # CPU core for the child (matches VoiceDetectionService.THREAD_CPU)
+    THREAD_CPU = 1
+
+    def __init__(
+        self,
+        model_name: str,
+        threshold: float,
+        frame_bytes: int,
+        capacity: int = 8,
+        use_int8: bool = False,
+        num_threads: int = 1,
+    ):
+        """Initialize hotword process (call start() to launch it).
+
+        Args:
+            model_name: openWakeWord model to load in the child
+            threshold: Detection threshold (0.0-1.0)
+            frame_bytes: Maximum size of one PCM16 mono frame in bytes
+            capacity: Number of frames the shared ring can hold
+            use_int8: Load the int8-quantized model in the child
+            num_threads: Threads for the melspectrogram and embedding models
+        """
+        self.model_name = model_name
+        self.threshold = threshold
+        self.use_int8 = use_int8
+        self.num_threads = num_threads
+
+        # spawn, not fork: the parent already runs PortAudio and event threads
+        self._ctx = multiprocessing.get_context("spawn")
+        self._ring = SharedAudioRing.create(capacity=capacity, frame_bytes=frame_bytes)
+        self._results = self._ctx.Queue()
+        self._stop_event = self._ctx.Event()
+        self._process: Optional[multiprocessing.Process] = None
+
+    def start(self):
+        """Launch the child process."""
+        self._process = self._ctx.Process(
+            target=_inference_worker,
+            args=(
+                self._ring.name,
+                self.model_name,
+                self.threshold,
+                self.use_int8,
+                self.num_threads,
+                self._results,
+                self._stop_event,
+            ),
+            name="hotword-inference",
+            daemon=True,
+        )
+        self._process.start()
+        logger.info(f"Hotword inference process started (pid {self._process.pid})")
+
+    def is_alive(self) -> bool:
+        """Whether the child process is running."""
+        return self._process is not None and self._process.is_alive()
+
+    @property
+    def exitcode(self) -> Optional[int]:
+        """Exit code of the child (None while it runs or before start())."""
+        return self._process.exitcode if self._process is not None else None
+
+    def submit(self, pcm16_data: bytes | memoryview):
+        """Hand a frame to the child (never blocks).
+
+        Args:
+            pcm16_data: PCM16 mono audio data
+        """
+        self._ring.write(pcm16_data)
+
+    def get_hits(self, timeout: float = 0.2) -> Optional[List[Tuple[str, float]]]:
+        """Wait for the next batch of hits from the child.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            List of (model name, score) pairs, or None on timeout
+        """
+        try:
+            return self._results.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def stop(self):
+        """Stop the child process and release the shared ring."""
+        self._stop_event.set()
+        if self._process is not None:
+            self._process.join(timeout=2.0)
+            if self._process.is_alive():
+                self._process.terminate()
+            self._process = None
+        self._ring.close()
+        logger.info("Hotword inference process stopped")
@@ -0,0 +1,195 @@
+"""Single-producer/single-consumer ring buffer for audio frames."""
+
+import threading
+from typing import Optional
+
+
+class RingBuffer:
+    """Fixed-capacity SPSC ring of audio frames backed by one preallocated bytearray.
+
+    The producer (PortAudio callback) only advances the write position and the
+    consumer only advances the read position. Both are plain ints updated under
+    the GIL, so neither side takes a lock on the data path. Writes copy the
+    frame into a preallocated slot; when the ring is full the new frame is
+    dropped (same behaviour as put_nowait on a full queue).
+    """
+
+    def __init__(self, capacity: int, frame_bytes: int):
+        """Initialize ring buffer.
+
+        Args:
+            capacity: Number of frame slots (rounded up to a power of two)
+            frame_bytes: Maximum size of one frame in bytes
+        """
+        size = 1
+        while size < capacity:
+            size <<= 1
+
+        self.capacity = size
+        self.frame_bytes = frame_bytes
+        self._mask = size - 1
+        self._buffer = bytearray(size * frame_bytes)
+        self._view = memoryview(self._buffer)
+        self._lengths = [0] * size
+
+        # Monotonic positions (slot = position & mask)
+        self._write_pos = 0  # Owned by producer
+        self._read_pos = 0  # Owned by consumer
+
+        # Signalled once per write to wake a blocked reader
+        self._data_ready = threading.Event()
+
+    def __len__(self) -> int:
+        """Number of frames available to read."""
+        return self._write_pos - self._read_pos
+
+    def write(self, data: bytes) -> bool:
+        """Copy a frame into the ring (producer side, never blocks).
+
+        Args:
+            data: Frame data (at most frame_bytes long)
+
+        Returns:
+            True if written, False if the ring was full and the frame was dropped
+        """
+        pos = self._write_pos
+        if pos - self._read_pos >= self.capacity:
+            return False
+
+        slot = pos & self._mask
+        start = slot * self.frame_bytes
+        n = len(data)
+        self._view[start : start + n] = data
+        self._lengths[slot] = n
+
+        # Publish only after the slot is fully written
+        self._write_pos = pos + 1
+        self._data_ready.set()
+        return True
+
+    def advance_reader_to_latest(self) -> int:
+        """Discard all but the newest frame (consumer side).
+
+        A single store to the read position, so a reader that has fallen
+        behind catches up without popping frames one at a time.
+
+        Returns:
+            Number of frames discarded
+        """
+        skipped = self._write_pos - self._read_pos - 1
+        if skipped <= 0:
+            return 0
+        self._read_pos += skipped
+        return skipped
+
+    def clear(self) -> int:
+        """Discard every buffered frame (consumer side).
+
+        Must run on the consumer's thread: a concurrent read would store its
+        older read position over this one and replay the discarded frames.
+
+        Returns:
+            Number of frames discarded
+        """
+        pos = self._write_pos
+        dropped = pos - self._read_pos
+        self._read_pos = pos
+        return dropped
+
+    def read_nowait(self) -> Optional[bytes]:
+        """Pop the oldest frame without waiting (consumer side).
+
+        Returns:
+            Frame data, or None if the ring is empty
+        """
+        pos = self._read_pos
+        if pos == self._write_pos:
+            return None
+
+        slot = pos & self._mask
+        start = slot * self.frame_bytes
+        data = bytes(self._view[start : start + self._lengths[slot]])
+        self._read_pos = pos + 1
+        return data
+
+    def read_into(self, out: bytearray, timeout: Optional[float] = None) -> int:
+        """Pop the oldest frame by appending it straight onto out.
+
+        Copies from the slot into the caller's buffer without creating an
+        intermediate bytes object.
+
+        Args:
+            out: Buffer to extend with the frame data
+            timeout: Maximum time to wait in seconds (None waits forever)
+
+        Returns:
+            Number of bytes appended (0 on timeout)
+        """
+        if self._read_pos == self._write_pos:
+            self._data_ready.clear()
+            if self._read_pos == self._write_pos and not self._data_ready.wait(timeout):
+                return 0
+
+        pos = self._read_pos
+        if pos == self._write_pos:
+            return 0
+
+        slot = pos & self._mask
+        start = slot * self.frame_bytes
+        n = self._lengths[slot]
+        out += self._view[start : start + n]
+        self._read_pos = pos + 1
+        return n
+
+    def peek(self, timeout: Optional[float] = None) -> Optional[memoryview]:
+        """Return a read-only view of the oldest frame without consuming it.
+
+        The slot cannot be overwritten until advance() is called, so the view
+        stays valid until then and the frame is never copied out of the ring.
+
+        Args:
+            timeout: Maximum time to wait in seconds (None waits forever)
+
+        Returns:
+            View of the frame data, or None on timeout
+        """
+        if self._read_pos == self._write_pos:
+            self._data_ready.clear()
+            if self._read_pos == self._write_pos and not self._data_ready.wait(timeout):
+                return None
+
+        pos = self._read_pos
+        if pos == self._write_pos:
+            return None
+
+        slot = pos & self._mask
+        start = slot * self.frame_bytes
+        return self._view[start : start + self._lengths[slot]].toreadonly()
+
+    def advance(self):
+        """Consume the frame returned by peek()."""
+        if self._read_pos != self._write_pos:
+            self._read_pos += 1
+
+    def read(self, timeout: Optional[float] = None) -> Optional[bytes]:
+        """Pop the oldest frame, waiting up to timeout for one to arrive.
+
+        Args:
+            timeout: Maximum time to wait in seconds (None waits forever)
+
+        Returns:
+            Frame data, or None on timeout
+        """
+        data = self.read_nowait()
+        if data is not None:
+            return data
+
+        # Clear, then re-check so a write between the two can't be missed
+        self._data_ready.clear()
+        data = self.read_nowait()
+        if data is not None:
+            return data
+
+        if not self._data_ready.wait(timeout):
+            return None
+        return self.read_nowait()
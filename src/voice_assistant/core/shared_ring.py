@@ -0,0 +1,191 @@
+"""Cross-process audio broadcast ring backed by shared memory."""
+
+import logging
+import time
+from multiprocessing import shared_memory
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Header: write position, capacity, frame size (uint64 each), padded to 64 bytes
+_HEADER_BYTES = 64
+_WRITE_POS, _CAPACITY, _FRAME_BYTES = 0, 1, 2
+
+
+class SharedAudioRing:
+    """Single-producer, multi-reader ring of audio frames in shared memory.
+
+    The producer (the PortAudio callback) copies each frame once into a slot of
+    a SharedMemory block and then publishes it by storing the new write
+    position in the block header. Readers in any process attach by name and
+    copy frames out through a memoryview, with no pickling or pipes in
+    between.
+
+    Readers keep their own read position, so any number of them can follow
+    the same ring. The producer never waits for them: once a reader falls
+    more than a full ring behind, the oldest frames are overwritten and the
+    reader skips forward (counted in ``dropped``).
+
+    Layout: 64-byte header | capacity x uint32 frame lengths | capacity x frame_bytes
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool):
+        """Wrap an existing shared memory block (use create() or attach()).
+
+        Args:
+            shm: Shared memory block holding the ring
+            owner: True for the producer that created (and will unlink) the block
+        """
+        self._shm = shm
+        self._owner = owner
+
+        self._header = shm.buf[:_HEADER_BYTES].cast("Q")
+        self.capacity = self._header[_CAPACITY]
+        self.frame_bytes = self._header[_FRAME_BYTES]
+        self._mask = self.capacity - 1
+
+        lengths_end = _HEADER_BYTES + 4 * self.capacity
+        self._lengths = shm.buf[_HEADER_BYTES:lengths_end].cast("I")
+        self._data = shm.buf[lengths_end : lengths_end + self.capacity * self.frame_bytes]
+
+        # Reader state (local to this process); new readers start at the live edge
+        self._read_pos = self._header[_WRITE_POS]
+        self.dropped = 0
+
+    @property
+    def name(self) -> str:
+        """Shared memory block name readers pass to attach()."""
+        return self._shm.name
+
+    @classmethod
+    def create(
+        cls, capacity: int, frame_bytes: int, name: Optional[str] = None
+    ) -> "SharedAudioRing":
+        """Allocate a new ring (producer side).
+
+        Args:
+            capacity: Number of frame slots (rounded up to a power of two)
+            frame_bytes: Maximum size of one frame in bytes
+            name: Shared memory name (None lets the OS pick one)
+
+        Returns:
+            Ring owned by the caller
+        """
+        size = 1
+        while size < capacity:
+            size <<= 1
+
+        total = _HEADER_BYTES + 4 * size + size * frame_bytes
+        shm = shared_memory.SharedMemory(name=name, create=True, size=total)
+        header = shm.buf[:_HEADER_BYTES].cast("Q")
+        header[_WRITE_POS] = 0
+        header[_CAPACITY] = size
+        header[_FRAME_BYTES] = frame_bytes
+        header.release()
+
+        logger.info(f"Shared audio ring '{shm.name}' created ({size} x {frame_bytes} bytes)")
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedAudioRing":
+        """Attach to a ring created by another process (reader side).
+
+        Args:
+            name: Name of the ring's shared memory block
+
+        Returns:
+            Ring positioned at the newest frame
+        """
+        try:
+            # Python 3.13+: don't let this process's resource tracker unlink the block
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            shm = shared_memory.SharedMemory(name=name)
+        return cls(shm, owner=False)
+
+    def write(self, data: bytes):
+        """Copy a frame into the ring and publish it (producer side, never blocks).
+
+        Args:
+            data: Frame data (at most frame_bytes long)
+        """
+        pos = self._header[_WRITE_POS]
+        slot = pos & self._mask
+        start = slot * self.frame_bytes
+        n = len(data)
+        self._data[start : start + n] = data
+        self._lengths[slot] = n
+
+        # Publish only after the slot is fully written (aligned 64-bit store)
+        self._header[_WRITE_POS] = pos + 1
+
+    def __len__(self) -> int:
+        """Number of frames this reader has not consumed yet (capped at capacity - 1)."""
+        return min(self._header[_WRITE_POS] - self._read_pos, self._mask)
+
+    def read_nowait(self) -> Optional[bytes]:
+        """Copy out this reader's next frame without waiting.
+
+        Returns:
+            Frame data, or None if the reader is at the live edge
+        """
+        while True:
+            write_pos = self._header[_WRITE_POS]
+            pos = self._read_pos
+            if pos == write_pos:
+                return None
+
+            # The slot at write_pos may be mid-write, so capacity - 1 frames are safe
+            oldest = write_pos - self._mask
+            if pos < oldest:
+                # Lapped by the producer - skip to the oldest frame still in the ring
+                self.dropped += oldest - pos
+                pos = oldest
+
+            slot = pos & self._mask
+            start = slot * self.frame_bytes
+            data = bytes(self._data[start : start + self._lengths[slot]])
+
+            # The producer may have reused the slot while we copied it
+            if pos < self._header[_WRITE_POS] - self._mask:
+                self._read_pos = pos
+                continue
+
+            self._read_pos = pos + 1
+            return data
+
+    def read(
+        self, timeout: Optional[float] = None, poll_interval: float = 0.005
+    ) -> Optional[bytes]:
+        """Copy out the next frame, polling up to timeout for one to arrive.
+
+        There is no cross-process wakeup, so an idle reader sleeps poll_interval
+        between checks (well under one 80ms audio chunk).
+
+        Args:
+            timeout: Maximum time to wait in seconds (None waits forever)
+            poll_interval: Sleep between checks in seconds
+
+        Returns:
+            Frame data, or None on timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            data = self.read_nowait()
+            if data is not None:
+                return data
+            if deadline is not None and time.monotonic() >= deadline:
+                return None
+            time.sleep(poll_interval)
+
+    def close(self):
+        """Detach from the ring; the producer also removes the shared memory block."""
+        self._header.release()
+        self._lengths.release()
+        self._data.release()
+        self._shm.close()
+        if self._owner:
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
@@ -1,17 +1,66 @@
 """Speaker service for audio playback with device selection support."""
 
+import collections
+import functools
 import logging
-import queue
 import threading
 import time
-from datetime import datetime
 from typing import Optional
 
 import pyaudio
 
+from .audio_devices import find_device, get_pa
+from .events import SpeakingFinishedEvent
+from .thread_priority import boost_current_thread
+
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
+def _default_output_device_info() -> dict:
+    """Get (and cache) PortAudio's default output device info.
+
+    Returns:
+        Device info dictionary for the default output device
+    """
+    return get_pa().get_default_output_device_info()
+
+
+@functools.lru_cache(maxsize=16)
+def _resolve_output_device(preferred_name: Optional[str]) -> int:
+    """Resolve an output device index by name, falling back to the default device.
+
+    Cached per name so restarting a SpeakerService does not re-enumerate every
+    PortAudio device. After hot-plugging, clear this cache and list_devices()'s.
+
+    Args:
+        preferred_name: Preferred output device name (partial match, case-insensitive),
+                        or None for the system default
+
+    Returns:
+        Device index to use for playback
+    """
+    # If no preferred device specified, use default
+    if not preferred_name:
+        default_device = _default_output_device_info()
+        logger.info(f"Using default output device: {default_device['name']}")
+        return default_device["index"]
+
+    # Search for preferred device (case-insensitive, partial match)
+    device = find_device(get_pa(), preferred_name, output=True)
+    if device is not None:
+        logger.info(f"Found preferred output device: {device.name} (index {device.index})")
+        return device.index
+
+    # Preferred device not found, fallback to default
+    default_device = _default_output_device_info()
+    logger.warning(
+        f"Preferred device '{preferred_name}' not found, "
+        f"falling back to default: {default_device['name']}"
+    )
+    return default_device["index"]
+
+
 class SpeakerService:
     """Handles audio playback from a queue with device selection support.
 
@@ -19,6 +68,9 @@ class SpeakerService:
     to the queue, and this service handles playback to the configured device.
     """
 
+    # CPU core the playback thread is pinned to
+    THREAD_CPU = 3
+
     def __init__(
         self,
         preferred_device_name: Optional[str] = None,
@@ -43,18 +95,19 @@ class SpeakerService:
         self.frames_per_buffer = frames_per_buffer
         self.event_bus = event_bus
 
-        # Initialize PyAudio
-        self.audio = pyaudio.PyAudio()
+        # Shared PyAudio instance (see get_pa)
+        self.audio = get_pa()
         self.playback_stream: Optional[pyaudio.Stream] = None
         self.device_index: Optional[int] = None
 
-        # Audio queue for playback
-        self.audio_queue = queue.Queue()
+        # Audio queue for playback: deque append/popleft are atomic under the GIL, and
+        # the event wakes the playback thread only when audio actually arrives
+        self.audio_queue: collections.deque = collections.deque()
+        self._audio_available = threading.Event()
 
         # Playback state
         self.playing = False
         self.playback_thread: Optional[threading.Thread] = None
-        self._monitor_thread: Optional[threading.Thread] = None
         self.running = False
 
         # Content completion tracking
@@ -75,30 +128,7 @@ class SpeakerService:
         Returns:
             Device index to use for playback
         """
-        # If no preferred device specified, use default
-        if not self.preferred_device_name:
-            default_device = self.audio.get_default_output_device_info()
-            logger.info(f"Using default output device: {default_device['name']}")
-            return default_device["index"]
-
-        # Search for preferred device (case-insensitive, partial match)
-        preferred_lower = self.preferred_device_name.lower()
-        for i in range(self.audio.get_device_count()):
-            info = self.audio.get_device_info_by_index(i)
-            # Check if it's an output device
-            if info.get("maxOutputChannels", 0) > 0:
-                device_name = info.get("name", "").lower()
-                if preferred_lower in device_name:
-                    logger.info(f"Found preferred output device: {info['name']} (index {i})")
-                    return i
-
-        # Preferred device not found, fallback to default
-        default_device = self.audio.get_default_output_device_info()
-        logger.warning(
-            f"Preferred device '{self.preferred_device_name}' not found, "
-            f"falling back to default: {default_device['name']}"
-        )
-        return default_device["index"]
+        return _resolve_output_device(self.preferred_device_name)
 
     def _start_playback_stream(self):
         """Start audio playback stream with selected device."""
@@ -139,61 +169,77 @@ class SpeakerService:
             finally:
                 self.playback_stream = None
 
-    def _monitor_stream_activity(self):
-        """Monitor stream activity to detect when playback completes.
-        
-        Watches stream.is_active() and raises speaking_finished event when
-        stream becomes inactive AND content_done is True AND queue is empty.
+    def _finish_if_content_done(self) -> bool:
+        """Raise speaking_finished if all content has been queued and written.
+
+        Called by the playback thread when the queue runs dry. By then every
+        chunk has been handed to PortAudio, so only the device's output latency
+        is left to play out.
+
+        Returns:
+            True if the event was raised
         """
-        logger.debug("Stream monitor thread started")
-        was_active = False
-        
-        while self.running:
+        with self._content_done_lock:
+            if not self.content_done or self.audio_queue:
+                return False
+            self.content_done = False
+
+        if self.playback_stream:
             try:
-                if self.playback_stream:
-                    is_active = self.playback_stream.is_active()
-                    queue_size = self.audio_queue.qsize()
-                    
-                    # Stream transitioned from active to inactive
-                    if was_active and not is_active:
-                        with self._content_done_lock:
-                            # Only trigger if content is done AND queue is empty
-                            # PyAudio's is_active() can be False between writes even when
-                            # there's still audio in the queue waiting to be written
-                            if self.content_done and queue_size == 0:
-                                # Playback truly complete!
-                                logger.debug("Stream inactive, content done, and queue empty - playback finished")
-                                self._raise_speaking_finished_event()
-                                self.content_done = False
-                            elif self.content_done and queue_size > 0:
-                                logger.debug(
-                                    f"Stream inactive and content done, but {queue_size} chunks still in queue - waiting"
-                                )
-                    
-                    was_active = is_active
-                else:
-                    # Stream not started yet, reset state
-                    was_active = False
-                
-                time.sleep(0.1)  # Check every 100ms
-                
+                time.sleep(self.playback_stream.get_output_latency())
             except Exception as e:
-                logger.error(f"Error in stream monitor: {e}", exc_info=True)
-                time.sleep(0.1)
-        
-        logger.debug("Stream monitor thread stopped")
+                logger.debug(f"Could not read output latency: {e}")
+
+        logger.debug("Content done and queue drained - playback finished")
+        self._raise_speaking_finished_event()
+        return True
 
     def _playback_loop(self):
         """Playback audio from queue in background thread."""
         logger.debug("Playback thread started")
+        boost_current_thread("speaker-playback", cpu=self.THREAD_CPU)
         chunks_played = 0
+        audio_queue = self.audio_queue
+        audio_available = self._audio_available
+        # Pending chunks are joined into one write of up to ~4 buffers, in a staging
+        # buffer allocated once for the life of the thread
+        max_coalesce_bytes = self.frames_per_buffer * 2 * self.channels * 4
+        batch_view = memoryview(bytearray(max_coalesce_bytes))
 
         while self.running:
             try:
-                # Get audio from queue (blocking with timeout)
-                audio_data = self.audio_queue.get(timeout=1.0)
+                try:
+                    audio_data = audio_queue.popleft()
+                except IndexError:
+                    # Clear, then re-check so an append between the two can't be missed.
+                    # play_audio(), mark_content_done() and stop() set the event.
+                    audio_available.clear()
+                    if not audio_queue and not self._finish_if_content_done():
+                        audio_available.wait()
+                    continue
+
                 chunks_played += 1
-                logger.debug(f"Playing audio chunk {chunks_played}: {len(audio_data)} bytes")
+                if audio_queue and len(audio_data) < max_coalesce_bytes:
+                    pos = len(audio_data)
+                    batch_view[:pos] = audio_data
+                    while audio_queue:
+                        try:
+                            chunk = audio_queue.popleft()
+                        except IndexError:
+                            break
+                        end = pos + len(chunk)
+                        if end > max_coalesce_bytes:
+                            audio_queue.appendleft(chunk)  # Next write starts with it
+                            break
+                        batch_view[pos:end] = chunk
+                        pos = end
+                        chunks_played += 1
+                    # PyAudio's write() only accepts read-only buffers; this is a view,
+                    # not a copy, and write() finishes with it before returning
+                    audio_data = batch_view[:pos].toreadonly()
+
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Playing up to chunk %d: %d bytes", chunks_played, len(audio_data))
 
                 # Start stream if not already started
                 if not self.playback_stream:
@@ -203,9 +249,6 @@ class SpeakerService:
                 if self.playback_stream:
                     self.playback_stream.write(audio_data)
 
-            except queue.Empty:
-                # No audio to play, continue waiting
-                continue
             except Exception as e:
                 logger.error(f"Error in playback loop: {e}", exc_info=True)
                 time.sleep(0.1)
@@ -215,7 +258,7 @@ class SpeakerService:
         logger.debug("Playback thread stopped")
 
     def start(self):
-        """Start the speaker service (starts playback and monitor threads)."""
+        """Start the speaker service (starts the playback thread)."""
         if self.running:
             logger.warning("Speaker service already started")
             return
@@ -223,53 +266,50 @@ class SpeakerService:
         self.running = True
         self.playback_thread = threading.Thread(target=self._playback_loop, daemon=True)
         self.playback_thread.start()
-        self._monitor_thread = threading.Thread(target=self._monitor_stream_activity, daemon=True)
-        self._monitor_thread.start()
         logger.info("Speaker service started")
 
     def stop(self):
-        """Stop the speaker service (stops playback and monitor threads)."""
+        """Stop the speaker service (stops the playback thread)."""
         if not self.running:
             return
 
         self.running = False
+        self._audio_available.set()  # Wake the idle playback thread
 
-        # Wait for threads to finish
+        # Wait for thread to finish
         if self.playback_thread and self.playback_thread.is_alive():
             self.playback_thread.join(timeout=2.0)
-        
-        if self._monitor_thread and self._monitor_thread.is_alive():
-            self._monitor_thread.join(timeout=2.0)
 
         self._stop_playback_stream()
         logger.info("Speaker service stopped")
 
-    def play_audio(self, audio_data: bytes):
+    def play_audio(self, audio_data: bytes | memoryview):
         """Queue audio data for playback.
 
         Args:
-            audio_data: PCM16 audio data to play
+            audio_data: PCM16 audio data to play. A memoryview is queued as-is
+                (not copied), so it must view memory that is never modified.
         """
         if not self.running:
             logger.warning("Speaker service not started, cannot play audio")
             return
 
         # If new audio arrives after content was marked done, reset the flag
-        # This handles interruption scenarios
-        with self._content_done_lock:
-            if self.content_done:
-                logger.debug("New audio received after content_done - resetting flag")
-                self.content_done = False
-
-        self.audio_queue.put(audio_data)
+        # This handles interruption scenarios. The unlocked check keeps the lock
+        # off the per-delta path; a mark_content_done() racing with it simply
+        # orders after this chunk.
+        if self.content_done:
+            with self._content_done_lock:
+                if self.content_done:
+                    logger.debug("New audio received after content_done - resetting flag")
+                    self.content_done = False
+
+        self.audio_queue.append(audio_data)
+        self._audio_available.set()
 
     def clear_queue(self):
         """Clear the audio playback queue."""
-        while not self.audio_queue.empty():
-            try:
-                self.audio_queue.get_nowait()
-            except queue.Empty:
-                break
+        self.audio_queue.clear()
         logger.debug("Audio playback queue cleared")
 
     def is_playing(self) -> bool:
@@ -280,7 +320,7 @@ class SpeakerService:
         """
         # Check queue state - if queue has audio, it's playing (or will be)
         # Don't rely on playing flag which can be set prematurely
-        return not self.audio_queue.empty()
+        return bool(self.audio_queue)
 
     def set_playing(self, playing: bool):
         """Set playing state (used to mark when playback session ends).
@@ -296,7 +336,7 @@ class SpeakerService:
         Returns:
             Number of audio chunks in queue
         """
-        return self.audio_queue.qsize()
+        return len(self.audio_queue)
 
     def mark_content_done(self):
         """Mark that all audio content has been added to the queue.
@@ -306,6 +346,7 @@ class SpeakerService:
         """
         with self._content_done_lock:
             self.content_done = True
+        self._audio_available.set()  # Wake the playback thread if it is already idle
         logger.debug(
             "Content marked as done - will raise speaking_finished event when playback completes"
         )
@@ -318,15 +359,15 @@ class SpeakerService:
             logger.debug("No event bus configured - skipping speaking_finished event")
             return
 
-        # Import here to avoid circular dependency
-        from .event_bus import SpeakingFinishedEvent
-
-        event = SpeakingFinishedEvent(timestamp=datetime.now())
+        event = SpeakingFinishedEvent(timestamp_ns=time.time_ns())
         self.event_bus.publish("speaking_finished", event)
         logger.info("Raised speaking_finished event")
 
     def cleanup(self):
-        """Clean up speaker service resources."""
+        """Clean up speaker service resources.
+
+        The shared PyAudio instance is not terminated here; it is released at
+        interpreter exit so other services can keep using it.
+        """
         self.stop()
-        self.audio.terminate()
         logger.info("SpeakerService cleaned up")
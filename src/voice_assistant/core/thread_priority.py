@@ -0,0 +1,58 @@
+"""Real-time scheduling helpers for audio threads.
+
+Raising priority requires CAP_SYS_NICE, e.g.:
+
+    sudo setcap cap_sys_nice+ep $(readlink -f $(which python3))
+
+Without it every call degrades gracefully (logged at DEBUG/WARNING level).
+"""
+
+import logging
+import os
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+def boost_current_thread(name: str, cpu: Optional[int] = None, priority: int = 20) -> bool:
+    """Pin the calling thread to a CPU and switch it to SCHED_FIFO.
+
+    Must be called from inside the thread's target function - on Linux, pid 0
+    refers to the calling thread for both affinity and scheduler calls.
+
+    Args:
+        name: Thread name used in log messages
+        cpu: CPU core to pin to (None leaves affinity unchanged). Ignored if
+             the core does not exist on this machine.
+        priority: SCHED_FIFO priority (1-99)
+
+    Returns:
+        True if SCHED_FIFO was applied, False if a fallback (or nothing) was used
+    """
+    if cpu is not None and hasattr(os, "sched_setaffinity"):
+        try:
+            if cpu in os.sched_getaffinity(0):
+                os.sched_setaffinity(0, {cpu})
+                logger.debug(f"{name}: pinned to CPU {cpu}")
+            else:
+                logger.debug(f"{name}: CPU {cpu} not available, affinity unchanged")
+        except OSError as e:
+            logger.debug(f"{name}: could not set CPU affinity: {e}")
+
+    if hasattr(os, "sched_setscheduler"):
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+            logger.info(f"{name}: running with SCHED_FIFO priority {priority}")
+            return True
+        except (OSError, AttributeError) as e:
+            logger.debug(f"{name}: SCHED_FIFO unavailable ({e}), falling back to nice")
+
+    try:
+        os.nice(-10)
+        logger.info(f"{name}: running with nice -10")
+    except (OSError, AttributeError) as e:
+        logger.warning(
+            f"{name}: could not raise thread priority ({e}); "
+            "grant CAP_SYS_NICE for real-time audio scheduling"
+        )
+    return False
@@ -0,0 +1,48 @@
+"""Non-blocking logging setup.
+
+Log records are put on an unbounded queue by a QueueHandler and written to
+stderr by a QueueListener thread, so audio/event threads never block on
+terminal or journal I/O.
+"""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+
+DEFAULT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+_listener: logging.handlers.QueueListener | None = None
+
+
+def setup_logging(level: int | str = logging.INFO, fmt: str = DEFAULT_FORMAT):
+    """Configure the root logger to log through a background QueueListener.
+
+    Safe to call more than once; later calls only update the level.
+
+    Args:
+        level: Logging level (e.g. logging.INFO or "DEBUG")
+        fmt: Log record format string
+    """
+    global _listener
+
+    if isinstance(level, str):
+        level = getattr(logging, level.upper())
+
+    root = logging.getLogger()
+    root.setLevel(level)
+
+    if _listener is not None:
+        return
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(fmt))
+
+    log_queue: queue.Queue = queue.Queue(-1)
+    root.handlers = [logging.handlers.QueueHandler(log_queue)]
+
+    _listener = logging.handlers.QueueListener(
+        log_queue, stream_handler, respect_handler_level=True
+    )
+    _listener.start()
+    atexit.register(_listener.stop)
@@ -2,9 +2,11 @@
 
 from .openai_client import OpenAIRealtimeClient
 from .state_machine import State, StateMachine
+from .transcription_client import OpenAITranscriptionClient
 
 __all__ = [
     "OpenAIRealtimeClient",
+    "OpenAITranscriptionClient",
     "State",
     "StateMachine",
 ]
@@ -0,0 +1,57 @@
+"""Base64 for realtime API audio payloads, using pybase64 (SIMD) when it is installed.
+
+Without pybase64 the C functions in binascii are called directly, skipping the
+base64 module's Python-level wrappers.
+"""
+
+import binascii
+
+try:
+    import pybase64
+
+    PYBASE64_AVAILABLE = True
+except ImportError:
+    PYBASE64_AVAILABLE = False
+
+
+def encode(data: bytes | bytearray | memoryview) -> bytes:
+    """Base64-encode a buffer.
+
+    Args:
+        data: Any bytes-like object (read in place)
+
+    Returns:
+        Base64 ASCII bytes
+    """
+    if PYBASE64_AVAILABLE:
+        return pybase64.b64encode(data)
+    return binascii.b2a_base64(data, newline=False)
+
+
+def encode_str(data: bytes | bytearray | memoryview) -> str:
+    """Base64-encode a buffer straight to a str (for embedding in a JSON dict).
+
+    Args:
+        data: Any bytes-like object (read in place)
+
+    Returns:
+        Base64 text
+    """
+    if PYBASE64_AVAILABLE:
+        return pybase64.b64encode_as_string(data)
+    return binascii.b2a_base64(data, newline=False).decode("ascii")
+
+
+def decode(data: str | bytes | memoryview) -> bytes:
+    """Decode base64 without strict validation.
+
+    Args:
+        data: Base64 text, or an ASCII bytes-like object (read in place)
+
+    Returns:
+        Decoded bytes
+    """
+    if PYBASE64_AVAILABLE:
+        return pybase64.b64decode(data, validate=False)
+    # a2b_base64 reads buffers in place (base64.b64decode copies them first)
+    return binascii.a2b_base64(data)
@@ -0,0 +1,41 @@
+"""JSON encoding for realtime API events, using orjson when it is installed."""
+
+import json
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps(message: dict) -> bytes:
+    """Serialize an outbound event to UTF-8 JSON.
+
+    Send the result with ``websocket.send(data, text=True)`` so it still goes
+    out as a text frame.
+
+    Args:
+        message: Event to serialize
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(message)
+    return json.dumps(message).encode()
+
+
+def loads(message: str | bytes) -> dict:
+    """Parse an inbound event.
+
+    Args:
+        message: JSON text or UTF-8 bytes received from the server
+
+    Returns:
+        Parsed event
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(message)
+    return json.loads(message)
@@ -1,19 +1,96 @@
 """OpenAI Realtime API client for bidirectional audio streaming."""
 
 import asyncio
-import base64
-import json
 import logging
-from typing import Callable, Optional
+import socket
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional, Tuple
 
 import websockets
 
+from . import base64_codec, json_codec
+from .realtime_messages import APPEND_PREFIX, APPEND_SUFFIX, INPUT_CLEAR, INPUT_COMMIT
+
 logger = logging.getLogger(__name__)
 
+# session.update is the same for every connection, so it is serialized once
+_SESSION_UPDATE = json_codec.dumps(
+    {
+        "type": "session.update",
+        "session": {
+            "type": "realtime",
+            "instructions": "You are a helpful voice assistant. Be concise and conversational.",
+        },
+    }
+)
+
+# Fixed control messages, encoded once
+_RESPONSE_CREATE = b'{"type":"response.create"}'
+_RESPONSE_CANCEL = b'{"type":"response.cancel"}'
+
+# Events that are only logged: type -> (log level, message)
+_LOG_ONLY_EVENTS: Dict[str, Tuple[int, str]] = {
+    "response.output_audio.done": (logging.INFO, "🎵 Audio response complete"),
+    "response.output_audio_transcript.done": (logging.DEBUG, "Transcript complete"),
+    "input_audio_buffer.speech_started": (logging.INFO, "Speech detected in input"),
+    "input_audio_buffer.speech_stopped": (logging.INFO, "Speech stopped in input"),
+    "input_audio_buffer.committed": (logging.DEBUG, "Audio buffer committed"),
+    "input_audio_buffer.cleared": (logging.DEBUG, "Audio buffer cleared"),
+    "conversation.item.created": (logging.DEBUG, "Conversation item created"),
+    "conversation.item.added": (logging.DEBUG, "Conversation item added"),
+    "conversation.item.done": (logging.DEBUG, "Conversation item done"),
+    "response.output_item.added": (logging.DEBUG, "Response output item added"),
+    "response.output_item.done": (logging.DEBUG, "Response output item done"),
+    "response.content_part.added": (logging.DEBUG, "Response content part added"),
+    "response.content_part.done": (logging.DEBUG, "Response content part done"),
+    "session.created": (logging.DEBUG, "Session created"),
+    "session.updated": (logging.DEBUG, "Session updated"),
+    "rate_limits.updated": (logging.DEBUG, "Rate limits updated"),
+}
+
+# Audio deltas are recognised on the raw frame, before any JSON parsing
+_AUDIO_DELTA_PREFIX = b'{"type":"response.output_audio.delta"'
+_DELTA_KEY = b'"delta":"'
+
+
+def _audio_delta_payload(message: bytes) -> Optional[memoryview]:
+    """Locate the base64 audio of a response.output_audio.delta frame without parsing it.
+
+    Base64 contains no characters JSON has to escape, so the payload is the raw
+    text between the quotes after "delta". Anything unexpected (other event
+    types, different key order or spacing, escapes) returns None so the caller
+    falls back to a full parse.
+
+    Args:
+        message: Raw UTF-8 WebSocket frame
+
+    Returns:
+        View of the base64 payload, or None if the frame is not a plain audio delta
+    """
+    if not message.startswith(_AUDIO_DELTA_PREFIX):
+        return None
+    start = message.find(_DELTA_KEY, len(_AUDIO_DELTA_PREFIX))
+    if start == -1:
+        return None
+    start += len(_DELTA_KEY)
+    end = message.find(b'"', start)
+    if end == -1 or message.find(b"\\", start, end) != -1:
+        return None
+    return memoryview(message)[start:end]
+
 
 class OpenAIRealtimeClient:
     """WebSocket client for OpenAI Realtime API."""
 
+    # Kernel socket buffer sizes for the websocket (bytes)
+    SOCKET_BUFFER_SIZE = 256 * 1024
+
+    # Streamed audio is batched into appends of ~100ms (PCM16 mono at 24kHz)
+    SEND_BLOCK_BYTES = 4800
+
+    # Base64 deltas at least this large are decoded on a worker thread
+    DECODE_OFFLOAD_BYTES = 64 * 1024
+
     def __init__(
         self,
         api_key: str,
@@ -29,16 +106,33 @@ class OpenAIRealtimeClient:
         self.model = model
         self.ws_url = f"wss://api.openai.com/v1/realtime?model={model}"
 
-        self.websocket: Optional[websockets.WebSocketClientProtocol] = None
+        self.websocket: Optional[websockets.ClientConnection] = None
         self.connected = False
         self.has_active_response = False  # Track if response is in progress
         self.response_id: Optional[str] = None  # Track current response ID
 
+        # Streamed audio not yet sent in an append message
+        self._send_buf = bytearray()
+
+        # Single worker keeps offloaded decodes in order (thread starts on first use)
+        self._decode_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="b64-decode")
+
         # Callbacks
         self.on_audio_delta: Optional[Callable[[bytes], None]] = None
         self.on_response_done: Optional[Callable[[], None]] = None
         self.on_error: Optional[Callable[[str], None]] = None
 
+        # Event type -> handler, so dispatch is one dict lookup per message
+        self._handlers: Dict[str, Callable[[dict], None]] = {
+            "response.output_audio.delta": self._handle_audio_delta,
+            "response.created": self._handle_response_created,
+            "response.done": self._handle_response_done,
+            "response.cancelled": self._handle_response_cancelled,
+            "error": self._handle_error,
+            "response.output_audio_transcript.delta": self._handle_transcript_delta,
+            "response.text.delta": self._handle_text_delta,
+        }
+
     async def connect(self, max_retries: int = 3, retry_delay: float = 1.0):
         """Establish WebSocket connection to OpenAI Realtime API with retry logic.
 
@@ -60,8 +154,11 @@ class OpenAIRealtimeClient:
                     additional_headers=headers,
                     ping_interval=20,  # Send ping every 20s to keep alive
                     ping_timeout=10,  # Wait 10s for pong
+                    compression=None,  # base64 audio barely deflates; skip zlib per frame
                 )
 
+                self._tune_socket()
+
                 self.connected = True
                 self.has_active_response = False
                 self.response_id = None
@@ -88,6 +185,26 @@ class OpenAIRealtimeClient:
 
         raise last_error or Exception("Failed to connect")
 
+    def _tune_socket(self):
+        """Disable Nagle, enable keepalive and enlarge buffers on the websocket socket.
+
+        Audio appends are small, latency-sensitive writes; without TCP_NODELAY
+        they can be held back waiting for ACKs of the previous segment.
+        """
+        transport = getattr(self.websocket, "transport", None)
+        sock = transport.get_extra_info("socket") if transport else None
+        if sock is None:
+            logger.debug("Websocket socket not available - skipping socket tuning")
+            return
+
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.SOCKET_BUFFER_SIZE)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.SOCKET_BUFFER_SIZE)
+        except OSError as e:
+            logger.warning(f"Could not tune websocket socket options: {e}")
+
     async def disconnect(self):
         """Close WebSocket connection."""
         if self.websocket:
@@ -106,19 +223,14 @@ class OpenAIRealtimeClient:
         Using absolute minimal configuration. OpenAI has removed most parameters
         from the API. They now auto-detect format and handle VAD internally.
         """
-        config = {
-            "type": "session.update",
-            "session": {
-                "type": "realtime",
-                "instructions": "You are a helpful voice assistant. Be concise and conversational.",
-            },
-        }
-
-        await self.websocket.send(json.dumps(config))
+        await self.websocket.send(_SESSION_UPDATE, text=True)
         logger.info("Session configured")
 
-    async def send_audio(self, audio_data: bytes):
-        """Send audio data to OpenAI.
+    async def send_audio(self, audio_data: bytes | memoryview):
+        """Queue audio for the server input buffer.
+
+        Audio is sent in appends of about SEND_BLOCK_BYTES; commit_audio() sends
+        whatever is left.
 
         Args:
             audio_data: PCM16 mono audio data (16-bit signed integer, little-endian)
@@ -127,26 +239,36 @@ class OpenAIRealtimeClient:
             logger.warning("Cannot send audio: not connected")
             return
 
-        # Validate audio format
-        if len(audio_data) == 0:
+        # Validate audio format (one length read covers both checks)
+        n = len(audio_data)
+        if n == 0:
             logger.warning("Empty audio data, skipping")
             return
 
-        if len(audio_data) % 2 != 0:
-            logger.warning(f"Audio data has odd number of bytes: {len(audio_data)}, truncating")
-            audio_data = audio_data[:-1]
+        if n & 1:
+            # Malformed chunk: drop the stray byte through a view, without copying
+            logger.warning(f"Audio data has odd number of bytes: {n}, truncating")
+            audio_data = memoryview(audio_data)[:-1]
 
-        try:
-            # Encode audio as base64
-            audio_base64 = base64.b64encode(audio_data).decode("utf-8")
+        self._send_buf += audio_data
+        if len(self._send_buf) >= self.SEND_BLOCK_BYTES:
+            await self._flush_audio()
 
-            message = {
-                "type": "input_audio_buffer.append",
-                "audio": audio_base64,
-            }
+    async def _flush_audio(self):
+        """Send the queued audio as one input_audio_buffer.append message."""
+        if not self._send_buf:
+            return
 
-            await self.websocket.send(json.dumps(message))
-            logger.debug(f"📤 Sent audio chunk: {len(audio_data)} bytes")
+        try:
+            # Base64 needs no JSON escaping, so the message is assembled directly
+            # as UTF-8 bytes and sent as a text frame
+            message = b"".join((APPEND_PREFIX, base64_codec.encode(self._send_buf), APPEND_SUFFIX))
+            sent = len(self._send_buf)
+            self._send_buf.clear()
+
+            await self.websocket.send(message, text=True)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("📤 Sent audio chunk: %d bytes", sent)
 
         except Exception as e:
             error_str = str(e)
@@ -159,14 +281,16 @@ class OpenAIRealtimeClient:
                 if self.on_error:
                     self.on_error(error_str)
 
-    async def send_complete_audio(self, audio_data: bytes):
+    async def send_complete_audio(self, audio_data: bytes | bytearray | memoryview):
         """Send complete audio as a conversation item (no streaming).
 
         This bypasses the input_audio_buffer and server-side VAD entirely.
         We collect all audio client-side, then send it in one message.
 
         Args:
-            audio_data: Complete PCM16 mono audio data for the entire utterance
+            audio_data: Complete PCM16 mono audio data for the entire utterance. Any
+                buffer-protocol object is accepted so callers can pass a memoryview
+                and avoid copying the utterance before encoding.
         """
         if not self.connected or not self.websocket:
             logger.warning("Cannot send audio: not connected")
@@ -177,8 +301,8 @@ class OpenAIRealtimeClient:
             return
 
         try:
-            # Encode complete audio as base64
-            audio_base64 = base64.b64encode(audio_data).decode("utf-8")
+            # Encode complete audio as base64 (the buffer is read directly)
+            audio_base64 = base64_codec.encode_str(audio_data)
 
             # Create conversation item with audio
             message = {
@@ -195,14 +319,11 @@ class OpenAIRealtimeClient:
                 },
             }
 
-            await self.websocket.send(json.dumps(message))
+            await self.websocket.send(json_codec.dumps(message), text=True)
             logger.info(f"Sent complete audio: {len(audio_data)} bytes")
 
             # Request response
-            response_message = {
-                "type": "response.create",
-            }
-            await self.websocket.send(json.dumps(response_message))
+            await self.websocket.send(_RESPONSE_CREATE, text=True)
             logger.info("Response requested")
 
         except Exception as e:
@@ -220,14 +341,12 @@ class OpenAIRealtimeClient:
             return
 
         try:
-            message = {"type": "input_audio_buffer.commit"}
-            await self.websocket.send(json.dumps(message))
+            await self._flush_audio()
+
+            await self.websocket.send(INPUT_COMMIT, text=True)
 
             # Request response generation (modalities set at session level)
-            response_message = {
-                "type": "response.create",
-            }
-            await self.websocket.send(json.dumps(response_message))
+            await self.websocket.send(_RESPONSE_CREATE, text=True)
 
             logger.info("Audio committed and response requested")
 
@@ -245,9 +364,9 @@ class OpenAIRealtimeClient:
             logger.debug("Cannot clear buffer: not connected")
             return
 
+        self._send_buf.clear()
         try:
-            message = {"type": "input_audio_buffer.clear"}
-            await self.websocket.send(json.dumps(message))
+            await self.websocket.send(INPUT_CLEAR, text=True)
             logger.debug("Audio buffer cleared")
         except Exception as e:
             logger.error(f"Error clearing audio buffer: {e}")
@@ -267,11 +386,14 @@ class OpenAIRealtimeClient:
             return False
 
         try:
-            message = {"type": "response.cancel"}
             if self.response_id:
-                message["response_id"] = self.response_id
+                message = json_codec.dumps(
+                    {"type": "response.cancel", "response_id": self.response_id}
+                )
+            else:
+                message = _RESPONSE_CANCEL
 
-            await self.websocket.send(json.dumps(message))
+            await self.websocket.send(message, text=True)
             logger.info(f"Response cancellation requested (id: {self.response_id})")
             self.has_active_response = False
             self.response_id = None
@@ -287,7 +409,10 @@ class OpenAIRealtimeClient:
             return
 
         try:
-            async for message in self.websocket:
+            while True:
+                # Undecoded frames skip UTF-8 decoding/validation and let
+                # _handle_message spot audio deltas as bytes
+                message = await self.websocket.recv(decode=False)
                 await self._handle_message(message)
         except asyncio.CancelledError:
             logger.info("Listen task cancelled")
@@ -301,110 +426,92 @@ class OpenAIRealtimeClient:
             if self.on_error:
                 self.on_error(str(e))
 
-    async def _handle_message(self, message: str):
+    async def _handle_message(self, message: str | bytes):
         """Handle incoming WebSocket message.
 
+        Audio deltas, the bulk of the traffic, are decoded straight from the raw
+        frame; every other event is parsed as JSON.
+
         Args:
-            message: JSON message from OpenAI
+            message: JSON message from OpenAI (UTF-8 bytes or str)
         """
         try:
-            data = json.loads(message)
+            if isinstance(message, bytes) and self.on_audio_delta:
+                payload = _audio_delta_payload(message)
+                if payload is not None:
+                    if len(payload) >= self.DECODE_OFFLOAD_BYTES:
+                        # Large delta: keep the loop free while it is decoded
+                        audio_data = await asyncio.get_running_loop().run_in_executor(
+                            self._decode_pool, base64_codec.decode, payload
+                        )
+                    else:
+                        audio_data = base64_codec.decode(payload)
+                    if audio_data:
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(f"📥 Received audio delta: {len(audio_data)} bytes")
+                        self.on_audio_delta(audio_data)
+                    return
+
+            data = json_codec.loads(message)
             event_type = data.get("type")
 
-            if event_type == "response.output_audio.delta":
-                # Audio chunk received (NEW format: response.output_audio.delta)
-                audio_base64 = data.get("delta", "")
-                if audio_base64 and self.on_audio_delta:
-                    audio_data = base64.b64decode(audio_base64)
-                    logger.info(f"📥 Received audio delta: {len(audio_data)} bytes")
-                    self.on_audio_delta(audio_data)
-
-            elif event_type == "response.output_audio.done":
-                logger.info("🎵 Audio response complete")
-
-            elif event_type == "response.done":
-                logger.info("✅ Response complete")
-                self.has_active_response = False
-                self.response_id = None
-                if self.on_response_done:
-                    self.on_response_done()
-
-            elif event_type == "error":
-                error_msg = data.get("error", {}).get("message", "Unknown error")
-                logger.error(f"API error: {error_msg}")
-                if self.on_error:
-                    self.on_error(error_msg)
-
-            elif event_type == "response.output_audio_transcript.delta":
-                # Transcript of what the AI is saying (NEW format)
-                transcript = data.get("delta", "")
-                if transcript:
-                    logger.info(f"💬 AI: {transcript}")
-
-            elif event_type == "response.output_audio_transcript.done":
-                logger.debug("Transcript complete")
-
-            elif event_type == "response.text.delta":
-                # Text response (if any)
-                text = data.get("delta", "")
-                if text:
-                    logger.info(f"AI text: {text}")
-
-            elif event_type == "input_audio_buffer.speech_started":
-                logger.info("Speech detected in input")
-
-            elif event_type == "input_audio_buffer.speech_stopped":
-                logger.info("Speech stopped in input")
-
-            elif event_type == "input_audio_buffer.committed":
-                logger.debug("Audio buffer committed")
-
-            elif event_type == "input_audio_buffer.cleared":
-                logger.debug("Audio buffer cleared")
-
-            elif event_type == "conversation.item.created":
-                logger.debug("Conversation item created")
-
-            elif event_type == "conversation.item.added":
-                logger.debug("Conversation item added")
-
-            elif event_type == "conversation.item.done":
-                logger.debug("Conversation item done")
-
-            elif event_type == "response.output_item.added":
-                logger.debug("Response output item added")
-
-            elif event_type == "response.output_item.done":
-                logger.debug("Response output item done")
-
-            elif event_type == "response.content_part.added":
-                logger.debug("Response content part added")
-
-            elif event_type == "response.content_part.done":
-                logger.debug("Response content part done")
-
-            elif event_type == "response.created":
-                self.has_active_response = True
-                self.response_id = data.get("response", {}).get("id")
-                logger.info(f"🤖 AI response started (id: {self.response_id})")
-
-            elif event_type == "response.cancelled":
-                logger.info("Response cancelled by server")
-                self.has_active_response = False
-                self.response_id = None
-
-            elif event_type == "session.created":
-                logger.debug("Session created")
-
-            elif event_type == "session.updated":
-                logger.debug("Session updated")
-
-            elif event_type == "rate_limits.updated":
-                logger.debug("Rate limits updated")
-
+            handler = self._handlers.get(event_type)
+            if handler is not None:
+                handler(data)
+            elif event_type in _LOG_ONLY_EVENTS:
+                level, text = _LOG_ONLY_EVENTS[event_type]
+                logger.log(level, text)
             else:
                 # Log unknown event types
                 logger.info(f"⚠️ Unknown event: {event_type}")
 
         except Exception as e:
             logger.error(f"Error handling message: {e}", exc_info=True)
+
+    def _handle_audio_delta(self, data: dict):
+        """Decode and forward an audio chunk (response.output_audio.delta)."""
+        audio_base64 = data.get("delta", "")
+        if audio_base64 and self.on_audio_delta:
+            audio_data = base64_codec.decode(audio_base64)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"📥 Received audio delta: {len(audio_data)} bytes")
+            self.on_audio_delta(audio_data)
+
+    def _handle_response_created(self, data: dict):
+        """Track the response that just started."""
+        self.has_active_response = True
+        self.response_id = data.get("response", {}).get("id")
+        logger.info(f"🤖 AI response started (id: {self.response_id})")
+
+    def _handle_response_done(self, data: dict):
+        """Clear response tracking and notify the consumer."""
+        logger.info("✅ Response complete")
+        self.has_active_response = False
+        self.response_id = None
+        if self.on_response_done:
+            self.on_response_done()
+
+    def _handle_response_cancelled(self, data: dict):
+        """Clear response tracking after a server-side cancel."""
+        logger.info("Response cancelled by server")
+        self.has_active_response = False
+        self.response_id = None
+
+    def _handle_error(self, data: dict):
+        """Log an API error and notify the consumer."""
+        error_msg = data.get("error", {}).get("message", "Unknown error")
+        logger.error(f"API error: {error_msg}")
+        if self.on_error:
+            self.on_error(error_msg)
+
+    def _handle_transcript_delta(self, data: dict):
+        """Log the transcript of what the AI is saying."""
+        transcript = data.get("delta", "")
+        if transcript:
+            logger.info(f"💬 AI: {transcript}")
+
+    def _handle_text_delta(self, data: dict):
+        """Log a text response (if any)."""
+        text = data.get("delta", "")
+        if text:
+            logger.info(f"AI text: {text}")
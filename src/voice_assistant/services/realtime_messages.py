@@ -0,0 +1,9 @@
+"""Pre-encoded input_audio_buffer messages shared by the realtime clients."""
+
+# input_audio_buffer.append message around the base64 payload
+APPEND_PREFIX = b'{"type":"input_audio_buffer.append","audio":"'
+APPEND_SUFFIX = b'"}'
+
+# Fixed control messages, encoded once
+INPUT_COMMIT = b'{"type":"input_audio_buffer.commit"}'
+INPUT_CLEAR = b'{"type":"input_audio_buffer.clear"}'
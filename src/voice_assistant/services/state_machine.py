@@ -20,6 +20,24 @@ class State(Enum):
 class StateMachine:
     """Thread-safe state machine for voice assistant."""
 
+    # Allowed (from, to) transitions:
+    # - IDLE -> LISTENING (hotword detected)
+    # - LISTENING -> PROCESSING (OpenAI response started)
+    # - LISTENING -> IDLE (nothing captured)
+    # - PROCESSING -> IDLE (response complete)
+    # - PROCESSING -> INTERRUPTED (user spoke during playback)
+    # - INTERRUPTED -> LISTENING (start new interaction)
+    _VALID_TRANSITIONS = frozenset(
+        {
+            (State.IDLE, State.LISTENING),
+            (State.LISTENING, State.PROCESSING),
+            (State.LISTENING, State.IDLE),
+            (State.PROCESSING, State.IDLE),
+            (State.PROCESSING, State.INTERRUPTED),
+            (State.INTERRUPTED, State.LISTENING),
+        }
+    )
+
     def __init__(self):
         """Initialize state machine."""
         self._state = State.IDLE
@@ -28,9 +46,12 @@ class StateMachine:
 
     @property
     def state(self) -> State:
-        """Get current state."""
-        with self._lock:
-            return self._state
+        """Get current state.
+
+        Lock-free: the state is a single reference, replaced in one store under
+        the lock, so a reader always sees either the old or the new state.
+        """
+        return self._state
 
     def transition(self, new_state: State) -> bool:
         """Transition to a new state.
@@ -58,23 +79,8 @@ class StateMachine:
             return True
 
     def _is_valid_transition(self, from_state: State, to_state: State) -> bool:
-        """Check if state transition is valid.
-
-        Valid transitions:
-        - IDLE -> LISTENING (hotword detected)
-        - LISTENING -> PROCESSING (OpenAI response started)
-        - PROCESSING -> IDLE (response complete)
-        - PROCESSING -> INTERRUPTED (user spoke during playback)
-        - INTERRUPTED -> LISTENING (start new interaction)
-        """
-        valid_transitions = {
-            State.IDLE: [State.LISTENING],
-            State.LISTENING: [State.PROCESSING, State.IDLE],
-            State.PROCESSING: [State.IDLE, State.INTERRUPTED],
-            State.INTERRUPTED: [State.LISTENING],
-        }
-
-        return to_state in valid_transitions.get(from_state, [])
+        """Check if state transition is valid (see _VALID_TRANSITIONS)."""
+        return (from_state, to_state) in self._VALID_TRANSITIONS
 
     def register_callback(self, from_state: State, to_state: State, callback: Callable):
         """Register a callback for a state transition.
@@ -91,8 +97,11 @@ class StateMachine:
 
     def _execute_callbacks(self, from_state: State, to_state: State):
         """Execute registered callbacks for a transition."""
-        key = (from_state, to_state)
-        for callback in self._callbacks.get(key, []):
+        callbacks = self._callbacks.get((from_state, to_state))
+        if not callbacks:
+            return
+
+        for callback in callbacks:
             try:
                 callback()
             except Exception as e:
@@ -0,0 +1,219 @@
+"""OpenAI realtime transcription client - streams microphone audio while the user speaks."""
+
+import asyncio
+import logging
+from typing import Optional
+
+import numpy as np
+import soxr
+import websockets
+
+from . import base64_codec, json_codec
+from .realtime_messages import APPEND_PREFIX, APPEND_SUFFIX, INPUT_CLEAR, INPUT_COMMIT
+
+logger = logging.getLogger(__name__)
+
+
+class OpenAITranscriptionClient:
+    """WebSocket client for OpenAI realtime transcription sessions.
+
+    Audio is appended to the server-side input buffer as it is captured, so by
+    the time the user stops speaking only the final commit remains. The
+    connection is kept open across utterances to reuse the TLS session.
+    """
+
+    # Realtime transcription sessions expect PCM16 at 24kHz
+    API_SAMPLE_RATE = 24000
+
+    # Resampled audio is batched into appends of ~100ms
+    SEND_BLOCK_BYTES = API_SAMPLE_RATE * 2 // 10
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-4o-transcribe",
+        input_sample_rate: int = 16000,
+        language: Optional[str] = "en",
+    ):
+        """Initialize transcription client.
+
+        Args:
+            api_key: OpenAI API key
+            model: Transcription model name (default: gpt-4o-transcribe)
+            input_sample_rate: Sample rate of the PCM16 mono audio passed to send_audio()
+            language: Optional language hint (ISO-639-1)
+        """
+        self.api_key = api_key
+        self.model = model
+        self.input_sample_rate = input_sample_rate
+        self.language = language
+        self.ws_url = "wss://api.openai.com/v1/realtime?intent=transcription"
+
+        self.websocket: Optional[websockets.ClientConnection] = None
+        self.connected = False
+        self.listen_task: Optional[asyncio.Task] = None
+
+        # Resampler state is kept across chunks of one utterance
+        self._resampler: Optional[soxr.ResampleStream] = None
+
+        # Resampled audio not yet sent in an append message
+        self._send_buf = bytearray()
+
+        # Pending transcript for the current commit
+        self._transcript_future: Optional[asyncio.Future] = None
+
+    async def connect(self):
+        """Open the WebSocket and configure the transcription session."""
+        self.websocket = await websockets.connect(
+            self.ws_url,
+            additional_headers={
+                "Authorization": f"Bearer {self.api_key}",
+                "OpenAI-Beta": "realtime=v1",
+            },
+            ping_interval=20,
+            ping_timeout=10,
+            compression=None,  # base64 audio barely deflates; skip zlib per frame
+        )
+        self.connected = True
+
+        transcription = {"model": self.model}
+        if self.language:
+            transcription["language"] = self.language
+
+        await self.websocket.send(
+            json_codec.dumps(
+                {
+                    "type": "transcription_session.update",
+                    "session": {
+                        "input_audio_format": "pcm16",
+                        "input_audio_transcription": transcription,
+                        "turn_detection": None,  # We commit on local VAD stop
+                    },
+                }
+            ),
+            text=True,
+        )
+
+        self.listen_task = asyncio.create_task(self._listen())
+        logger.info(f"Connected to OpenAI realtime transcription (model={self.model})")
+
+    async def ensure_connected(self):
+        """Connect if there is no open connection."""
+        if not self.connected or not self.websocket:
+            await self.connect()
+
+    async def disconnect(self):
+        """Close WebSocket connection."""
+        self.connected = False
+        if self.listen_task and not self.listen_task.done():
+            self.listen_task.cancel()
+        if self.websocket:
+            try:
+                await self.websocket.close()
+            except Exception as e:
+                logger.debug(f"Error during websocket close: {e}")
+            finally:
+                self.websocket = None
+                logger.info("Disconnected from OpenAI realtime transcription")
+
+    async def begin_utterance(self):
+        """Start a new utterance (clears server buffer and resampler state)."""
+        await self.ensure_connected()
+        self._resampler = soxr.ResampleStream(
+            self.input_sample_rate, self.API_SAMPLE_RATE, 1, dtype="int16"
+        )
+        self._send_buf.clear()
+        await self.websocket.send(INPUT_CLEAR, text=True)
+
+    async def send_audio(self, audio_data: bytes | memoryview, last: bool = False):
+        """Resample and append a PCM16 mono chunk to the server input buffer.
+
+        Raw PCM16 is sent as-is (no WAV framing); the session is configured with
+        input_audio_format=pcm16. Resampled audio goes out in appends of about
+        SEND_BLOCK_BYTES, and the last chunk sends whatever is left.
+
+        Args:
+            audio_data: PCM16 mono audio at input_sample_rate (any bytes-like object)
+            last: True for the final chunk of the utterance (flushes the resampler)
+        """
+        if not self.connected or not self.websocket or self._resampler is None:
+            return
+
+        samples = np.frombuffer(audio_data, dtype=np.int16)
+        resampled = self._resampler.resample_chunk(samples, last=last)
+        self._send_buf += memoryview(resampled)
+        if not self._send_buf or (len(self._send_buf) < self.SEND_BLOCK_BYTES and not last):
+            return
+
+        # Base64 needs no JSON escaping, so the message is assembled directly as
+        # UTF-8 bytes (sent as a text frame) instead of via json.dumps
+        message = b"".join((APPEND_PREFIX, base64_codec.encode(self._send_buf), APPEND_SUFFIX))
+        self._send_buf.clear()
+        await self.websocket.send(message, text=True)
+
+    async def commit(self, timeout: float = 15.0) -> Optional[str]:
+        """Commit the buffered utterance and wait for its transcript.
+
+        Args:
+            timeout: Maximum time to wait for the transcript in seconds
+
+        Returns:
+            Transcribed text, or None on error/timeout
+        """
+        if not self.connected or not self.websocket:
+            logger.warning("Cannot commit: not connected")
+            return None
+
+        await self.send_audio(b"", last=True)
+        self._resampler = None
+
+        self._transcript_future = asyncio.get_running_loop().create_future()
+        await self.websocket.send(INPUT_COMMIT, text=True)
+
+        try:
+            return await asyncio.wait_for(self._transcript_future, timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"Timed out waiting for transcript ({timeout}s)")
+            return None
+        finally:
+            self._transcript_future = None
+
+    def _resolve(self, transcript: Optional[str]):
+        """Complete the pending commit, if any."""
+        if self._transcript_future and not self._transcript_future.done():
+            self._transcript_future.set_result(transcript)
+
+    async def _listen(self):
+        """Receive server events until the connection closes."""
+        try:
+            while True:
+                # Undecoded frames skip the UTF-8 decode/validation pass
+                message = await self.websocket.recv(decode=False)
+                data = json_codec.loads(message)
+                event_type = data.get("type")
+
+                if event_type == "conversation.item.input_audio_transcription.completed":
+                    self._resolve(data.get("transcript", ""))
+
+                elif event_type == "conversation.item.input_audio_transcription.failed":
+                    error_msg = data.get("error", {}).get("message", "Unknown error")
+                    logger.error(f"Transcription failed: {error_msg}")
+                    self._resolve(None)
+
+                elif event_type == "error":
+                    error_msg = data.get("error", {}).get("message", "Unknown error")
+                    logger.error(f"API error: {error_msg}")
+                    self._resolve(None)
+
+                else:
+                    logger.debug("Transcription event: %s", event_type)
+
+        except asyncio.CancelledError:
+            raise
+        except websockets.exceptions.ConnectionClosed:
+            logger.warning("Transcription WebSocket connection closed")
+        except Exception as e:
+            logger.error(f"Error in transcription listen loop: {e}")
+        finally:
+            self.connected = False
+            self._resolve(None)